@@ -0,0 +1,354 @@
+"""
+Versioned JSON API for users and movies (/api/v1).
+
+The HTML routes redirect and flash; machine clients use these instead:
+
+- GET/POST          /api/v1/users
+- GET/DELETE        /api/v1/users/<id>
+- GET/POST          /api/v1/users/<id>/movies
+- GET/PATCH/DELETE  /api/v1/users/<id>/movies/<movie_id>
+
+Reads select only the requested columns and serialize the plain rows
+(no ORM objects are built). Query parameters of list endpoints:
+
+- fields: comma-separated sparse fieldset, e.g. fields=name,year
+  ("id" is always included)
+- limit: page size (capped at API_MAX_PAGE_SIZE)
+- after / before: cursors from a previous response
+- q: search term (movies only)
+
+Responses about one user's library carry a strong ETag derived from the
+library version, so unchanged resources are answered with 304.
+"""
+
+from flask import Blueprint, current_app, jsonify, request, url_for
+
+from data_manager import DuplicateMovieError, MovieRecord
+from models import Movie
+from omdb_client import parse_year
+from validators import etag_matches, library_etag, set_validators
+
+api = Blueprint("api", __name__, url_prefix="/api/v1")
+
+USER_FIELDS = ("id", "name", "movie_count")
+MOVIE_FIELDS = MovieRecord._fields
+
+
+class APIError(Exception):
+    """An error answered as {"error": message} with an HTTP status."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+@api.errorhandler(APIError)
+def handle_api_error(error):
+    """Answer an APIError as JSON."""
+    return jsonify({"error": error.message}), error.status
+
+
+def init_api(app, data_manager, enrichment_worker=None):
+    """
+    Register the API blueprint.
+
+    Args:
+        app (Flask): The application;
+        data_manager (DataManager): Data access for the views;
+        enrichment_worker (EnrichmentWorker | None): If given, movies
+            created with a title only get their details in the background.
+    """
+    app.extensions["api"] = {
+        "data_manager": data_manager,
+        "enrichment_worker": enrichment_worker,
+    }
+    app.register_blueprint(api)
+
+
+def _data_manager():
+    return current_app.extensions["api"]["data_manager"]
+
+
+def parse_fields(allowed):
+    """
+    Return the fields requested with ?fields=, in the order of `allowed`.
+
+    Raises:
+        APIError: If an unknown field is requested.
+    """
+    raw = request.args.get("fields")
+    if not raw:
+        return list(allowed)
+
+    requested = {field.strip() for field in raw.split(",") if field.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise APIError(f"Unknown fields: {', '.join(sorted(unknown))}.")
+    return [field for field in allowed if field == "id" or field in requested]
+
+
+def parse_limit(default):
+    """
+    Return the page size requested with ?limit=.
+
+    Raises:
+        APIError: If it is not a number between 1 and API_MAX_PAGE_SIZE.
+    """
+    raw = request.args.get("limit")
+    if raw is None:
+        return default
+
+    max_limit = current_app.config["API_MAX_PAGE_SIZE"]
+    try:
+        limit = int(raw)
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= max_limit:
+        raise APIError(f"limit must be between 1 and {max_limit}.")
+    return limit
+
+
+def serialize(row, columns, fields):
+    """Turn a row of `columns` into a dict of the requested fields."""
+    return {
+        column: value
+        for column, value in zip(columns, row)
+        if column in fields
+    }
+
+
+def json_body():
+    """
+    Return the request's JSON object.
+
+    Raises:
+        APIError: If the body is not a JSON object.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        raise APIError("Expected a JSON object.")
+    return data
+
+
+def text_field(data, name):
+    """Return a stripped string field of a JSON body, or None if empty."""
+    value = data.get(name)
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise APIError(f"{name} must be a string.")
+    return value.strip() or None
+
+
+def year_field(data):
+    """Return the year of a JSON body as an int, or None if absent."""
+    value = data.get("year")
+    if value in (None, ""):
+        return None
+    year = parse_year(value)
+    if year is None:
+        raise APIError("year must be a number.")
+    return year
+
+
+def get_user_or_404(user_id):
+    """Return the user's UserRecord or raise a 404 APIError."""
+    user = _data_manager().get_user(user_id)
+    if user is None:
+        raise APIError("User not found.", 404)
+    return user
+
+
+def cached_json(user_id, build, eager=False):
+    """
+    Answer a GET with validators: 304 if the client's copy is current.
+
+    The caller must have checked that the resource exists, or pass
+    eager=True: a 304 (e.g. to If-None-Match: *) must not be sent for
+    a resource that is gone.
+
+    Args:
+        user_id (int): Whose library the resource belongs to;
+        build (callable): Returns the JSON-serializable body (may raise
+            a 404 APIError);
+        eager (bool): Build the body before comparing validators.
+    """
+    version = _data_manager().get_library_version(user_id)
+    etag = library_etag(
+        user_id, version.version if version else 0, current_app.config["MOVIES_PAGE_SIZE"]
+    )
+    # After the version is read, so the body is never older than the ETag
+    body = build() if eager else None
+    if etag_matches(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify(body if eager else build())
+    return set_validators(response, etag)
+
+
+@api.route("/users", methods=["GET"])
+def list_users():
+    """Return a page of users: {"users": [...], "next_cursor", "prev_cursor"}."""
+    fields = parse_fields(USER_FIELDS)
+    with_counts = "movie_count" in fields
+    page = _data_manager().get_user_page(
+        page_size=parse_limit(current_app.config["USERS_PAGE_SIZE"]),
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+        with_counts=with_counts,
+    )
+    columns = USER_FIELDS if with_counts else USER_FIELDS[:2]
+    return jsonify({
+        "users": [serialize(row, columns, fields) for row in page.users],
+        "next_cursor": page.next_cursor,
+        "prev_cursor": page.prev_cursor,
+    })
+
+
+@api.route("/users", methods=["POST"])
+def create_user():
+    """Create a user from {"name": ...}; 409 if the name is taken."""
+    name = text_field(json_body(), "name")
+    if not name:
+        raise APIError("name must not be empty.")
+
+    manager = _data_manager()
+    if manager.get_user_by_name(name):
+        raise APIError(f"User '{name}' already exists.", 409)
+
+    user = manager.create_user(name)
+    response = jsonify({"id": user.id, "name": user.name, "movie_count": 0})
+    response.status_code = 201
+    response.headers["Location"] = url_for("api.get_user", user_id=user.id)
+    return response
+
+
+@api.route("/users/<int:user_id>", methods=["GET"])
+def get_user(user_id):
+    """Return one user."""
+    user = get_user_or_404(user_id)
+    fields = parse_fields(USER_FIELDS)
+
+    def build():
+        data = serialize(user, USER_FIELDS[:2], fields)
+        if "movie_count" in fields:
+            data["movie_count"] = _data_manager().get_movie_count(user_id)
+        return data
+
+    return cached_json(user_id, build)
+
+
+@api.route("/users/<int:user_id>", methods=["DELETE"])
+def delete_user(user_id):
+    """Delete a user and all their movies."""
+    get_user_or_404(user_id)
+    if not _data_manager().delete_user(user_id):
+        raise APIError("User not found.", 404)
+    return "", 204
+
+
+@api.route("/users/<int:user_id>/movies", methods=["GET"])
+def list_movies(user_id):
+    """Return a page of a user's movies: {"movies": [...], "next_cursor", "prev_cursor"}."""
+    get_user_or_404(user_id)
+    fields = parse_fields(MOVIE_FIELDS)
+    page_size = parse_limit(current_app.config["MOVIES_PAGE_SIZE"])
+    search = (request.args.get("q") or "").strip() or None
+
+    def build():
+        page = _data_manager().get_movie_rows(
+            user_id,
+            fields,
+            search=search,
+            page_size=page_size,
+            after=request.args.get("after"),
+            before=request.args.get("before"),
+        )
+        return {
+            "movies": [dict(zip(fields, row)) for row in page.movies],
+            "next_cursor": page.next_cursor,
+            "prev_cursor": page.prev_cursor,
+        }
+
+    return cached_json(user_id, build)
+
+
+@api.route("/users/<int:user_id>/movies", methods=["POST"])
+def create_movie(user_id):
+    """
+    Add a movie from {"title", "year", "director", "poster_url"}.
+
+    Only the title is required. A movie created with its title only gets
+    its details from OMDb in the background (when configured).
+    """
+    data = json_body()
+    title = text_field(data, "title")
+    if not title:
+        raise APIError("title must not be empty.")
+    details = {
+        "year": year_field(data),
+        "director": text_field(data, "director"),
+        "poster_url": text_field(data, "poster_url"),
+    }
+
+    get_user_or_404(user_id)
+    movie = Movie(name=title, user_id=user_id, **details)
+    try:
+        _data_manager().add_movie(movie)
+    except DuplicateMovieError as exc:
+        raise APIError(f"Movie '{title}' is already in the library.", 409) from exc
+
+    enrichment_worker = current_app.extensions["api"]["enrichment_worker"]
+    if enrichment_worker is not None and not any(details.values()):
+        enrichment_worker.enqueue(movie)
+
+    response = jsonify({field: getattr(movie, field) for field in MOVIE_FIELDS})
+    response.status_code = 201
+    response.headers["Location"] = url_for("api.get_movie", user_id=user_id, movie_id=movie.id)
+    return response
+
+
+@api.route("/users/<int:user_id>/movies/<int:movie_id>", methods=["GET"])
+def get_movie(user_id, movie_id):
+    """Return one of a user's movies."""
+    fields = parse_fields(MOVIE_FIELDS)
+
+    def build():
+        row = _data_manager().get_movie_row(user_id, movie_id, fields)
+        if row is None:
+            raise APIError("Movie not found.", 404)
+        return dict(zip(fields, row))
+
+    # A single-row lookup: build it first, it tells whether the movie exists
+    return cached_json(user_id, build, eager=True)
+
+
+@api.route("/users/<int:user_id>/movies/<int:movie_id>", methods=["PATCH"])
+def update_movie(user_id, movie_id):
+    """Change any of {"title", "year", "director", "poster_url"} of a movie."""
+    data = json_body()
+    changes = {
+        "title": text_field(data, "title"),
+        "year": year_field(data),
+        "director": text_field(data, "director"),
+        "poster_url": text_field(data, "poster_url"),
+    }
+    if not any(value is not None for value in changes.values()):
+        raise APIError("No changes provided.")
+
+    try:
+        row = _data_manager().update_movie(user_id, movie_id, **changes)
+    except DuplicateMovieError as exc:
+        raise APIError(f"Movie '{changes['title']}' is already in the library.", 409) from exc
+    if row is None:
+        raise APIError("Movie not found.", 404)
+    return jsonify(serialize(row, MOVIE_FIELDS, MOVIE_FIELDS))
+
+
+@api.route("/users/<int:user_id>/movies/<int:movie_id>", methods=["DELETE"])
+def delete_movie(user_id, movie_id):
+    """Remove a movie from a user's library."""
+    if not _data_manager().delete_movie(user_id, movie_id):
+        raise APIError("Movie not found.", 404)
+    return "", 204
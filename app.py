@@ -5,29 +5,52 @@ This module:
 - Initializes the Flask app and database connection
 - Loads configuration and external API keys from the environment
 - Defines all routes for managing users and their movies
-- Integrates with the DataManager and the OMDb API
+  (the JSON API lives in api.py)
+- Integrates with the DataManager and the OMDb API (through a response cache)
 - Handles adding, updating, deleting, and displaying movies
 - Provides error handling and flash messaging
 """
 
 import os
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
-from flask import Flask, render_template, request, redirect, url_for, abort, flash
-
-from data_manager import DataManager
-from models import db, Movie
+from flask import (
+    Flask, render_template, request, redirect, url_for, abort, flash, jsonify,
+    make_response, session, get_flashed_messages, stream_template
+)
+
+from api import init_api
+from bulk_import import dedupe_titles, lookup_titles, parse_titles
+from circuit_breaker import CircuitBreaker
+from data_manager import DataManager, DuplicateMovieError
+from enrichment import EnrichmentWorker
+from group_commit import GroupCommitWriter
+from http_compression import init_compression
+from migrate import DuplicateMoviesFound, upgrade_schema
+from models import db, Movie, OMDbMissEntry, register_sqlite_pragmas
+from movie_list_cache import MovieListCache, create_backend
+from omdb_cache import OMDbCache
+from omdb_client import OMDbClient, OMDbUnavailableError, movie_fields, parse_year
+from rate_limiter import TokenBucket
+from user_cache import UserCache
+from validators import etag_matches, library_etag, set_validators
 
 load_dotenv()
 
 # Base directory and DB path using pathlib
 BASE_DIR = Path(__file__).resolve().parent
-DB_PATH = BASE_DIR / "data" / "movies.db"
+DB_PATH = Path(os.environ.get("DATABASE_PATH", BASE_DIR / "data" / "movies.db"))
 
 app = Flask(__name__)
 
+# Drop the blank lines and indentation {% %} tags leave in the HTML
+app.jinja_env.trim_blocks = True
+app.jinja_env.lstrip_blocks = True
+
 # Secret key for sessions and flash messages
 secret_key = os.environ.get("SECRET_KEY")
 if not secret_key:
@@ -37,35 +60,239 @@ app.secret_key = secret_key
 # External API key
 OMDB_API_KEY = os.environ.get("OMDB_API_KEY")
 
+# OMDb response cache (TTL in seconds, size caps in entries)
+app.config["OMDB_CACHE_TTL"] = int(os.environ.get("OMDB_CACHE_TTL", 7 * 24 * 3600))
+app.config["OMDB_CACHE_MEMORY_SIZE"] = int(os.environ.get("OMDB_CACHE_MEMORY_SIZE", 1024))
+app.config["OMDB_CACHE_MAX_ENTRIES"] = int(os.environ.get("OMDB_CACHE_MAX_ENTRIES", 50000))
+
+# Negative cache for "not found" titles (typos): shorter TTL, smaller caps
+app.config["OMDB_MISS_CACHE_TTL"] = int(os.environ.get("OMDB_MISS_CACHE_TTL", 24 * 3600))
+app.config["OMDB_MISS_CACHE_MEMORY_SIZE"] = int(
+    os.environ.get("OMDB_MISS_CACHE_MEMORY_SIZE", 512)
+)
+app.config["OMDB_MISS_CACHE_MAX_ENTRIES"] = int(
+    os.environ.get("OMDB_MISS_CACHE_MAX_ENTRIES", 10000)
+)
+
+# OMDb HTTP client (connection pool ≈ number of worker threads, timeouts in seconds)
+app.config["OMDB_POOL_SIZE"] = int(os.environ.get("OMDB_POOL_SIZE", 10))
+app.config["OMDB_MAX_RETRIES"] = int(os.environ.get("OMDB_MAX_RETRIES", 2))
+app.config["OMDB_BACKOFF_FACTOR"] = float(os.environ.get("OMDB_BACKOFF_FACTOR", 0.3))
+app.config["OMDB_CONNECT_TIMEOUT"] = float(os.environ.get("OMDB_CONNECT_TIMEOUT", 2))
+app.config["OMDB_READ_TIMEOUT"] = float(os.environ.get("OMDB_READ_TIMEOUT", 4))
+app.config["OMDB_LOCK_DIR"] = os.environ.get("OMDB_LOCK_DIR", str(BASE_DIR / "data" / "locks"))
+
+# Circuit breaker: stop calling OMDb while it fails or is too slow
+app.config["OMDB_BREAKER_FAILURE_RATE"] = float(os.environ.get("OMDB_BREAKER_FAILURE_RATE", 0.5))
+app.config["OMDB_BREAKER_SLOW_CALL"] = float(os.environ.get("OMDB_BREAKER_SLOW_CALL", 3))
+app.config["OMDB_BREAKER_WINDOW"] = int(os.environ.get("OMDB_BREAKER_WINDOW", 20))
+app.config["OMDB_BREAKER_MIN_CALLS"] = int(os.environ.get("OMDB_BREAKER_MIN_CALLS", 5))
+app.config["OMDB_BREAKER_OPEN_SECONDS"] = float(os.environ.get("OMDB_BREAKER_OPEN_SECONDS", 30))
+
+# Token bucket for the OMDb API key, shared by all worker processes
+app.config["OMDB_RATE_PER_SECOND"] = float(os.environ.get("OMDB_RATE_PER_SECOND", 5))
+app.config["OMDB_RATE_BURST"] = int(os.environ.get("OMDB_RATE_BURST", 10))
+app.config["OMDB_DAILY_BUDGET"] = int(os.environ.get("OMDB_DAILY_BUDGET", 1000))
+
+# Asynchronous enrichment: save the title at once, fetch OMDb details in the background
+app.config["OMDB_ASYNC_ENRICHMENT"] = (
+    os.environ.get("OMDB_ASYNC_ENRICHMENT", "").lower() in ("1", "true", "yes")
+)
+app.config["ENRICHMENT_WORKERS"] = int(os.environ.get("ENRICHMENT_WORKERS", 2))
+app.config["ENRICHMENT_POLL_INTERVAL"] = float(os.environ.get("ENRICHMENT_POLL_INTERVAL", 5))
+app.config["ENRICHMENT_MAX_ATTEMPTS"] = int(os.environ.get("ENRICHMENT_MAX_ATTEMPTS", 5))
+app.config["ENRICHMENT_RETRY_DELAY"] = float(os.environ.get("ENRICHMENT_RETRY_DELAY", 60))
+
+# Bulk import: concurrent OMDb lookups and max titles per request
+app.config["IMPORT_WORKERS"] = int(
+    os.environ.get("IMPORT_WORKERS", app.config["OMDB_POOL_SIZE"])
+)
+app.config["IMPORT_MAX_TITLES"] = int(os.environ.get("IMPORT_MAX_TITLES", 1000))
+
+# Movies shown per page of a user's library
+app.config["MOVIES_PAGE_SIZE"] = int(os.environ.get("MOVIES_PAGE_SIZE", 50))
+# Stream movie list pages while the movies are read (for very large pages)
+app.config["MOVIES_STREAMING"] = (
+    os.environ.get("MOVIES_STREAMING", "").lower() in ("1", "true", "yes")
+)
+# Movies read per round-trip, and min characters per sent chunk, when streaming
+app.config["MOVIES_STREAM_CHUNK_SIZE"] = int(os.environ.get("MOVIES_STREAM_CHUNK_SIZE", 100))
+app.config["MOVIES_STREAM_BUFFER_SIZE"] = int(os.environ.get("MOVIES_STREAM_BUFFER_SIZE", 8192))
+
+# Users shown per page on the home page
+app.config["USERS_PAGE_SIZE"] = int(os.environ.get("USERS_PAGE_SIZE", 50))
+
+# Largest ?limit= accepted by the JSON API (/api/v1)
+app.config["API_MAX_PAGE_SIZE"] = int(os.environ.get("API_MAX_PAGE_SIZE", 500))
+
+# Per-process cache of users (id → name) in front of get_user
+app.config["USER_CACHE_TTL"] = int(os.environ.get("USER_CACHE_TTL", 300))
+app.config["USER_CACHE_SIZE"] = int(os.environ.get("USER_CACHE_SIZE", 10000))
+# Max seconds before a user deleted by another process is noticed
+app.config["USER_CACHE_CHECK_INTERVAL"] = float(
+    os.environ.get("USER_CACHE_CHECK_INTERVAL", 1)
+)
+
+# Cache of movie list pages: "memory" (per process), "redis" (shared) or "" (off)
+app.config["MOVIE_LIST_CACHE_BACKEND"] = os.environ.get("MOVIE_LIST_CACHE_BACKEND", "memory")
+app.config["MOVIE_LIST_CACHE_URL"] = os.environ.get(
+    "MOVIE_LIST_CACHE_URL", "redis://localhost:6379/0"
+)
+app.config["MOVIE_LIST_CACHE_TTL"] = int(os.environ.get("MOVIE_LIST_CACHE_TTL", 60))
+app.config["MOVIE_LIST_CACHE_SIZE"] = int(os.environ.get("MOVIE_LIST_CACHE_SIZE", 1000))
+
+# Group commit: one writer thread commits user/movie writes in batches
+app.config["WRITE_BATCH_ENABLED"] = (
+    os.environ.get("WRITE_BATCH_ENABLED", "").lower() in ("1", "true", "yes")
+)
+app.config["WRITE_BATCH_MAX_OPS"] = int(os.environ.get("WRITE_BATCH_MAX_OPS", 64))
+app.config["WRITE_BATCH_MAX_DELAY_MS"] = float(os.environ.get("WRITE_BATCH_MAX_DELAY_MS", 2))
+
+# gzip/brotli compression of HTML and JSON responses (not static files)
+app.config["COMPRESSION_ENABLED"] = (
+    os.environ.get("COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes")
+)
+app.config["COMPRESSION_MIN_SIZE"] = int(os.environ.get("COMPRESSION_MIN_SIZE", 500))
+app.config["COMPRESSION_GZIP_LEVEL"] = int(os.environ.get("COMPRESSION_GZIP_LEVEL", 6))
+app.config["COMPRESSION_BROTLI_QUALITY"] = int(os.environ.get("COMPRESSION_BROTLI_QUALITY", 4))
+
+if app.config["COMPRESSION_ENABLED"]:
+    init_compression(
+        app,
+        min_size=app.config["COMPRESSION_MIN_SIZE"],
+        gzip_level=app.config["COMPRESSION_GZIP_LEVEL"],
+        brotli_quality=app.config["COMPRESSION_BROTLI_QUALITY"],
+    )
+
 # Configure SQLAlchemy
 app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{DB_PATH}"
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+# SQLite PRAGMAs applied to every connection (empty value = SQLite default).
+# WAL lets readers proceed while a writer commits; NORMAL sync is safe in WAL.
+# foreign_keys enables ON DELETE CASCADE (off by default in SQLite).
+app.config["SQLITE_PRAGMAS"] = {
+    "foreign_keys": "ON",
+    "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000"),
+    "cache_size": os.environ.get("SQLITE_CACHE_SIZE", "-20000"),  # negative = KiB
+    "mmap_size": os.environ.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)),
+}
+
 # Link the database and the app
 db.init_app(app)
 
-# Data manager instance
-data_manager = DataManager()
-
+with app.app_context():
+    register_sqlite_pragmas(db.engine, app.config["SQLITE_PRAGMAS"])
 
-def parse_year(year_str):
-    """
-    Convert a raw year string to an integer, if possible.
-
-    Returns:
-        int | None: Parsed year, or None if the input is empty/invalid.
-    """
-    if not year_str:
-        return None
-
-    year_str = str(year_str).strip()
-    if not year_str:
-        return None
+# Optional group-commit writer shared by all requests in this process
+write_batcher = (
+    GroupCommitWriter(
+        app,
+        max_ops=app.config["WRITE_BATCH_MAX_OPS"],
+        max_delay=app.config["WRITE_BATCH_MAX_DELAY_MS"] / 1000,
+    )
+    if app.config["WRITE_BATCH_ENABLED"]
+    else None
+)
+
+# Users cached by this process, invalidated by any process' user writes
+user_cache = UserCache(
+    ttl=app.config["USER_CACHE_TTL"],
+    max_size=app.config["USER_CACHE_SIZE"],
+    check_interval=app.config["USER_CACHE_CHECK_INTERVAL"],
+)
+
+# Movie list pages, invalidated by every write to a user's library
+movie_list_cache = (
+    MovieListCache(
+        create_backend(
+            app.config["MOVIE_LIST_CACHE_BACKEND"],
+            url=app.config["MOVIE_LIST_CACHE_URL"],
+            max_size=app.config["MOVIE_LIST_CACHE_SIZE"],
+            ttl=app.config["MOVIE_LIST_CACHE_TTL"],
+        ),
+        ttl=app.config["MOVIE_LIST_CACHE_TTL"],
+    )
+    if app.config["MOVIE_LIST_CACHE_BACKEND"]
+    else None
+)
 
-    try:
-        return int(year_str)
-    except ValueError:
-        return None
+# Data manager instance
+data_manager = DataManager(
+    writer=write_batcher,
+    user_cache=user_cache,
+    movie_cache=movie_list_cache,
+)
+
+# Cache of OMDb responses shared by all requests in this process
+omdb_cache = OMDbCache(
+    ttl=app.config["OMDB_CACHE_TTL"],
+    memory_size=app.config["OMDB_CACHE_MEMORY_SIZE"],
+    max_entries=app.config["OMDB_CACHE_MAX_ENTRIES"],
+)
+omdb_miss_cache = OMDbCache(
+    ttl=app.config["OMDB_MISS_CACHE_TTL"],
+    memory_size=app.config["OMDB_MISS_CACHE_MEMORY_SIZE"],
+    max_entries=app.config["OMDB_MISS_CACHE_MAX_ENTRIES"],
+    model=OMDbMissEntry,
+)
+
+# Breaker shared by all threads of this process
+omdb_breaker = CircuitBreaker(
+    "omdb",
+    failure_rate_threshold=app.config["OMDB_BREAKER_FAILURE_RATE"],
+    slow_call_threshold=app.config["OMDB_BREAKER_SLOW_CALL"],
+    window_size=app.config["OMDB_BREAKER_WINDOW"],
+    min_calls=app.config["OMDB_BREAKER_MIN_CALLS"],
+    open_duration=app.config["OMDB_BREAKER_OPEN_SECONDS"],
+)
+
+# Rate limit for calls made with OMDB_API_KEY (state lives in SQLite)
+omdb_rate_limiter = TokenBucket(
+    "omdb",
+    rate=app.config["OMDB_RATE_PER_SECOND"],
+    capacity=app.config["OMDB_RATE_BURST"],
+    daily_budget=app.config["OMDB_DAILY_BUDGET"] or None,
+)
+
+# One pooled keep-alive client for all OMDb lookups in this process
+omdb_client = OMDbClient(
+    api_key=OMDB_API_KEY,
+    cache=omdb_cache,
+    negative_cache=omdb_miss_cache,
+    pool_size=app.config["OMDB_POOL_SIZE"],
+    max_retries=app.config["OMDB_MAX_RETRIES"],
+    backoff_factor=app.config["OMDB_BACKOFF_FACTOR"],
+    connect_timeout=app.config["OMDB_CONNECT_TIMEOUT"],
+    read_timeout=app.config["OMDB_READ_TIMEOUT"],
+    lock_dir=app.config["OMDB_LOCK_DIR"],
+    breaker=omdb_breaker,
+    rate_limiter=omdb_rate_limiter,
+)
+
+# Background worker for asynchronous enrichment (threads start with the first request)
+enrichment_worker = EnrichmentWorker(
+    app,
+    client=omdb_client,
+    data_manager=data_manager,
+    max_workers=app.config["ENRICHMENT_WORKERS"],
+    poll_interval=app.config["ENRICHMENT_POLL_INTERVAL"],
+    max_attempts=app.config["ENRICHMENT_MAX_ATTEMPTS"],
+    retry_delay=app.config["ENRICHMENT_RETRY_DELAY"],
+)
+
+
+@app.before_request
+def start_enrichment_worker():
+    """Start the enrichment threads, so jobs queued before a restart still run."""
+    if OMDB_API_KEY:
+        enrichment_worker.ensure_started()
+
+
+# JSON API; its movies created by title only are enriched in the background
+init_api(app, data_manager, enrichment_worker=enrichment_worker if OMDB_API_KEY else None)
 
 
 def create_basic_movie(title, user_id, flash_message=None, category="info"):
@@ -79,10 +306,16 @@ def create_basic_movie(title, user_id, flash_message=None, category="info"):
         category (str): Flash category (e.g. "info", "warning").
 
     Returns:
-        Movie: The created Movie instance.
+        Movie | None: The created Movie instance, or None if the user
+        already has this title (a warning is flashed instead).
     """
     movie = Movie(name=title, user_id=user_id)
-    data_manager.add_movie(movie)
+    try:
+        data_manager.add_movie(movie)
+    except DuplicateMovieError:
+        flash(f"Movie '{title}' is already in your library.", "warning")
+        return None
+
     if flash_message:
         flash(flash_message, category)
     return movie
@@ -100,37 +333,42 @@ def create_movie_from_omdb(data, fallback_title, user_id):
         user_id (int): ID of the user who owns the movie.
 
     Returns:
-        Movie: The created Movie instance.
+        Movie | None: The created Movie instance, or None if the user
+        already has this title (a warning is flashed instead).
     """
-    name = data.get("Title") or fallback_title
-
-    director = data.get("Director")
-    if director in (None, "N/A"):
-        director = None
-
-    year_val = parse_year(data.get("Year"))
+    fields = movie_fields(data, fallback_title)
+    name = fields["name"]
 
-    poster = data.get("Poster")
-    if poster in (None, "N/A"):
-        poster = None
+    movie = Movie(user_id=user_id, **fields)
+    try:
+        data_manager.add_movie(movie)
+    except DuplicateMovieError:
+        flash(f"Movie '{name}' is already in your library.", "warning")
+        return None
 
-    movie = Movie(
-        name=name,
-        director=director,
-        year=year_val,
-        poster_url=poster,
-        user_id=user_id,
-    )
-    data_manager.add_movie(movie)
     flash(f"Movie '{name}' added successfully!", "success")
     return movie
 
 
 @app.route("/")
 def index():
-    """Show a list of all registered users and a form for adding new users."""
-    users = data_manager.get_users()
-    return render_template("index.html", users=users)
+    """
+    Show a page of registered users and a form for adding new users.
+
+    Optional query parameters:
+        after / before (str): Page cursors from the previous/next links.
+    """
+    page = data_manager.get_user_page(
+        page_size=app.config["USERS_PAGE_SIZE"],
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+    )
+    return render_template(
+        "index.html",
+        users=page.users,
+        next_cursor=page.next_cursor,
+        prev_cursor=page.prev_cursor,
+    )
 
 
 @app.route("/users", methods=["POST"])
@@ -170,25 +408,115 @@ def delete_user(user_id):
     return redirect(url_for("index"))
 
 
+def buffered(chunks, size):
+    """Join small template output pieces into chunks of at least `size` characters."""
+    buffer = []
+    length = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield "".join(buffer)
+            buffer = []
+            length = 0
+    if buffer:
+        yield "".join(buffer)
+
+
 @app.route("/users/<int:user_id>/movies", methods=["GET"])
 def get_movies(user_id):
     """
     Display the user’s list of favorite movies.
 
-    Optional query parameter:
+    Answers 304 Not Modified after a single library version lookup when
+    the browser's copy (If-None-Match / If-Modified-Since) is current.
+
+    With MOVIES_STREAMING, forward pages are streamed: the header and the
+    first movies are sent while the rest are still being read. Search
+    pages are ordered by relevance within the page, so they are rendered
+    in one piece.
+
+    Optional query parameters:
         q (str): If provided, filter movies by a search term.
+        after / before (str): Page cursors from the previous/next links.
     """
     user = data_manager.get_user(user_id)
     if user is None:
         abort(404)
 
+    # A page carrying flash messages is one-off: never validate or reuse it
+    etag = last_modified = library_version = None
+    if not session.get("_flashes"):
+        version = data_manager.get_library_version(user_id)
+        library_version = version.version if version else 0
+        etag = library_etag(user_id, library_version, app.config["MOVIES_PAGE_SIZE"])
+        # Last-Modified has one-second resolution: leave it out while
+        # another write could still land within the same second
+        if version is not None and time.time() - version.updated_at >= 1:
+            last_modified = datetime.fromtimestamp(int(version.updated_at), tz=timezone.utc)
+
+        if request.if_none_match:
+            not_modified = etag_matches(etag)
+        else:
+            not_modified = (
+                last_modified is not None
+                and request.if_modified_since is not None
+                and last_modified <= request.if_modified_since
+            )
+        if not_modified:
+            return set_validators(app.response_class(status=304), etag, last_modified)
+
     search_term = (request.args.get("q") or "").strip()
-    movies = data_manager.get_movies(
-        user_id,
+    if app.config["MOVIES_STREAMING"] and not request.args.get("before") and not search_term:
+        # Pop the flashes now: the session cookie goes out with the headers
+        get_flashed_messages(with_categories=True)
+        page = data_manager.stream_movie_page(
+            user_id,
+            page_size=app.config["MOVIES_PAGE_SIZE"],
+            after=request.args.get("after"),
+            chunk_size=app.config["MOVIES_STREAM_CHUNK_SIZE"],
+        )
+        response = app.response_class(buffered(
+            stream_template(
+                "movies.html",
+                user=user,
+                movies=page,
+                page=page,
+                search=search_term,
+                enrichment=page.statuses,
+            ),
+            app.config["MOVIES_STREAM_BUFFER_SIZE"],
+        ))
+    else:
+        # The cached page is looked up under the version the ETag names
+        response = render_movie_page(user, search_term, library_version)
+
+    if etag is None:
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    return set_validators(response, etag, last_modified)
+
+
+def render_movie_page(user, search_term, library_version=None):
+    """Render a movie list page in one piece (see get_movies)."""
+    page = data_manager.get_movie_page(
+        user.id,
         search=search_term if search_term else None,
+        page_size=app.config["MOVIES_PAGE_SIZE"],
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+        version=library_version,
     )
+    enrichment = data_manager.get_enrichment_statuses([movie.id for movie in page.movies])
 
-    return render_template("movies.html", user=user, movies=movies, search=search_term)
+    return make_response(render_template(
+        "movies.html",
+        user=user,
+        movies=page.movies,
+        page=page,
+        search=search_term,
+        enrichment=enrichment,
+    ))
 
 
 @app.route('/users/<int:user_id>/movies', methods=['POST'])
@@ -196,21 +524,20 @@ def add_movie(user_id):
     """
     Add a movie for a given user.
     - Reads the movie title from the form
-    - Enforces one-title-per-user uniqueness
-    - Fetches info from OMDb (if available)
+    - Enforces one-title-per-user uniqueness (via the database's unique index)
+    - Fetches info from OMDb (if available), either right away or,
+      in asynchronous mode, through a background enrichment job
     - Falls back gracefully if data is missing or OMDb fails
     """
+    if data_manager.get_user(user_id) is None:
+        abort(404)
+
     # Single validation step → single early return
     title = (request.form.get("title") or "").strip()
     if not title:
         flash("Please enter a movie title.", "warning")
         return redirect(url_for("get_movies", user_id=user_id))
 
-    # First uniqueness check (user input title, case-insensitive)
-    if data_manager.movie_exists_for_user(user_id, title):
-        flash(f"Movie '{title}' is already in your library.", "warning")
-        return redirect(url_for("get_movies", user_id=user_id))
-
     # If no API key, just create a basic movie and fall through to the final redirect
     if not OMDB_API_KEY:
         create_basic_movie(
@@ -222,15 +549,23 @@ def add_movie(user_id):
             ),
             category="info",
         )
+    elif app.config["OMDB_ASYNC_ENRICHMENT"]:
+        # Save the title now (one local write), fill in details later
+        movie = create_basic_movie(
+            title=title,
+            user_id=user_id,
+            flash_message=(
+                f"Movie '{title}' added! "
+                "Details from the movie database will appear shortly."
+            ),
+            category="success",
+        )
+        if movie is not None:
+            enrichment_worker.enqueue(movie)
     else:
-        # Try fetching from OMDb, but avoid extra returns
+        # Try fetching from OMDb (or the cache), but avoid extra returns
         try:
-            response = requests.get(
-                "http://www.omdbapi.com/",
-                params={"t": title, "apikey": OMDB_API_KEY},
-                timeout=5,
-            )
-            data = response.json()
+            data = omdb_client.lookup(title)
 
             if data.get("Response") == "False":
                 # OMDb didn't find the movie → basic movie only
@@ -244,20 +579,28 @@ def add_movie(user_id):
                     category="warning",
                 )
             else:
-                # OMDb found something → use OMDb title for stricter uniqueness
-                omdb_title = data.get("Title") or title
-
-                if data_manager.movie_exists_for_user(user_id, omdb_title):
-                    flash(
-                        f"Movie '{omdb_title}' is already in your library.",
-                        "warning",
-                    )
-                else:
-                    create_movie_from_omdb(
-                        data=data,
-                        fallback_title=title,
-                        user_id=user_id,
-                    )
+                # OMDb found something → saved under the OMDb title, whose
+                # uniqueness the database checks on insert
+                create_movie_from_omdb(
+                    data=data,
+                    fallback_title=title,
+                    user_id=user_id,
+                )
+
+        except OMDbUnavailableError as exc:
+            # Breaker open or rate limit used up → don't wait for OMDb,
+            # fill in the details once it can be called again
+            movie = create_basic_movie(
+                title=title,
+                user_id=user_id,
+                flash_message=(
+                    "The movie database is busy right now. "
+                    "We added your movie and will fill in its details later."
+                ),
+                category="warning",
+            )
+            if movie is not None:
+                enrichment_worker.enqueue(movie, delay=exc.retry_at - time.time())
 
         except (requests.exceptions.RequestException, ValueError):
             # Network/JSON issues → still add a basic movie
@@ -275,6 +618,173 @@ def add_movie(user_id):
     return redirect(url_for("get_movies", user_id=user_id))
 
 
+def import_titles(user_id, titles):
+    """
+    Add many titles to a user's library at once.
+
+    Titles already in the library are skipped, OMDb lookups run
+    concurrently and all new movies are saved in one transaction.
+
+    Args:
+        user_id (int): ID of the user who owns the movies;
+        titles (list[str]): Deduplicated titles.
+
+    Returns:
+        list[dict]: One result per title: title, status
+        ("added", "added_title_only", "queued" or "duplicate"), name and movie_id.
+    """
+    existing = data_manager.get_existing_titles(user_id, titles)
+    results = {
+        title: {"title": title, "status": "duplicate", "name": None, "movie_id": None}
+        for title in titles
+    }
+    new_titles = [title for title in titles if title.lower() not in existing]
+
+    async_mode = bool(OMDB_API_KEY) and app.config["OMDB_ASYNC_ENRICHMENT"]
+    lookups = {}
+    if OMDB_API_KEY and not async_mode:
+        lookups = lookup_titles(app, omdb_client, new_titles, app.config["IMPORT_WORKERS"])
+
+    # Stricter uniqueness: OMDb may normalize several inputs to one title
+    found = {
+        title: movie_fields(data, title)
+        for title, data in lookups.items()
+        if isinstance(data, dict) and data.get("Response") != "False"
+    }
+    existing |= data_manager.get_existing_titles(
+        user_id, [fields["name"] for fields in found.values()]
+    )
+
+    movies = []
+    enrich_now = []
+    enrich_later = []
+    retry_at = time.time()
+
+    for title in new_titles:
+        fields = found.get(title) or {"name": title}
+        if fields["name"].lower() in existing:
+            continue
+        existing.add(fields["name"].lower())
+
+        movie = Movie(user_id=user_id, **fields)
+        movies.append(movie)
+        results[title]["movie"] = movie
+
+        error = lookups.get(title)
+        if title in found:
+            results[title]["status"] = "added"
+        elif async_mode:
+            enrich_now.append(movie)
+            results[title]["status"] = "queued"
+        elif isinstance(error, OMDbUnavailableError):
+            enrich_later.append(movie)
+            retry_at = max(retry_at, error.retry_at)
+            results[title]["status"] = "queued"
+        else:
+            results[title]["status"] = "added_title_only"
+
+    saved = {id(movie) for movie in data_manager.add_movies(movies)}
+    enrichment_worker.enqueue_many([m for m in enrich_now if id(m) in saved])
+    enrichment_worker.enqueue_many(
+        [m for m in enrich_later if id(m) in saved],
+        delay=retry_at - time.time(),
+    )
+
+    for result in results.values():
+        movie = result.pop("movie", None)
+        if movie is None:
+            continue
+        if id(movie) in saved:
+            result["name"] = movie.name
+            result["movie_id"] = movie.id
+        else:
+            # Added concurrently by another request
+            result["status"] = "duplicate"
+
+    return list(results.values())
+
+
+def read_import_titles():
+    """
+    Return the raw titles of a bulk import request.
+
+    Only .csv (text/csv) uploads are parsed as CSV; pasted lists and
+    other uploads are one title per line, commas included.
+
+    Raises:
+        ValueError: If a JSON body is not an array.
+    """
+    if request.is_json:
+        return parse_titles(json_data=request.get_json(silent=True))
+
+    upload = request.files.get("file")
+    if not upload or not upload.filename:
+        return parse_titles(text=request.form.get("titles", ""))
+
+    text = upload.read().decode("utf-8-sig", errors="replace")
+    is_csv = upload.filename.lower().endswith(".csv") or upload.mimetype == "text/csv"
+    return parse_titles(text=text, is_csv=is_csv)
+
+
+@app.route("/users/<int:user_id>/movies/import", methods=["POST"])
+def import_movies(user_id):
+    """
+    Add many movies for a given user at once.
+
+    Accepts a JSON array of titles, an uploaded CSV/text file ("file")
+    or a newline-separated list ("titles"). JSON requests get per-title
+    results back; form posts get a flash summary.
+    """
+    started = time.perf_counter()
+
+    user = data_manager.get_user(user_id)
+    if user is None:
+        abort(404)
+
+    try:
+        raw_titles = read_import_titles()
+    except ValueError as exc:
+        if request.is_json:
+            return jsonify({"error": str(exc)}), 400
+        flash(str(exc), "warning")
+        return redirect(url_for("get_movies", user_id=user_id))
+
+    titles = dedupe_titles(raw_titles)
+    max_titles = app.config["IMPORT_MAX_TITLES"]
+
+    if not titles or len(titles) > max_titles:
+        message = f"Please provide between 1 and {max_titles} movie titles."
+        if request.is_json:
+            return jsonify({"error": message}), 400
+        flash(message, "warning")
+        return redirect(url_for("get_movies", user_id=user_id))
+
+    results = import_titles(user_id, titles)
+    elapsed = round(time.perf_counter() - started, 3)
+
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+
+    if request.is_json:
+        return jsonify({
+            "results": results,
+            "counts": counts,
+            "duplicates_in_input": len(raw_titles) - len(titles),
+            "elapsed_seconds": elapsed,
+        })
+
+    added = len(results) - counts.get("duplicate", 0)
+    flash(
+        f"Imported {added} of {len(titles)} movies in {elapsed:.1f}s "
+        f"({counts.get('duplicate', 0)} already in your library, "
+        f"{counts.get('added_title_only', 0) + counts.get('queued', 0)} "
+        f"without details yet).",
+        "success" if added else "info",
+    )
+    return redirect(url_for("get_movies", user_id=user_id))
+
+
 @app.route("/users/<int:user_id>/movies/<int:movie_id>/update", methods=["POST"])
 def update_movie(user_id, movie_id):
     """
@@ -304,12 +814,17 @@ def update_movie(user_id, movie_id):
         flash("No changes provided to update.", "warning")
         return redirect(url_for("get_movies", user_id=user_id))
 
-    updated = data_manager.update_movie(
-        movie_id,
-        title=new_title,
-        year=year_val,
-        director=new_director,
-    )
+    try:
+        updated = data_manager.update_movie(
+            user_id,
+            movie_id,
+            title=new_title,
+            year=year_val,
+            director=new_director,
+        )
+    except DuplicateMovieError:
+        flash(f"Movie '{new_title}' is already in your library.", "warning")
+        return redirect(url_for("get_movies", user_id=user_id))
 
     if updated is None:
         abort(404)
@@ -321,14 +836,34 @@ def update_movie(user_id, movie_id):
 @app.route("/users/<int:user_id>/movies/<int:movie_id>/delete", methods=["POST"])
 def delete_movie(user_id, movie_id):
     """Remove a specific movie from a user's favorite movie list."""
-    success = data_manager.delete_movie(movie_id)
-    if not success:
+    deleted = data_manager.delete_movie(user_id, movie_id)
+    if not deleted:
         abort(404)
 
     flash("Movie deleted.", "info")
     return redirect(url_for("get_movies", user_id=user_id))
 
 
+@app.route("/stats")
+def stats():
+    """Return cache counters, OMDb budget and enrichment queue sizes as JSON."""
+    return jsonify({
+        "omdb_cache": omdb_cache.stats(),
+        "omdb_miss_cache": {
+            **omdb_miss_cache.stats(),
+            # Every negative-cache hit is an OMDb round-trip we did not make
+            "upstream_calls_avoided": omdb_miss_cache.hits,
+        },
+        "omdb_single_flight": omdb_client.flight.stats(),
+        "omdb_circuit_breaker": omdb_breaker.stats(),
+        "omdb_rate_limit": omdb_rate_limiter.stats(),
+        "enrichment_jobs": data_manager.get_enrichment_counts(),
+        "group_commit": write_batcher.stats() if write_batcher else None,
+        "user_cache": user_cache.stats(),
+        "movie_list_cache": movie_list_cache.stats() if movie_list_cache else None,
+    })
+
+
 @app.errorhandler(404)
 def page_not_found(_error):
     """Render custom 404 page."""
@@ -337,7 +872,12 @@ def page_not_found(_error):
 
 if __name__ == "__main__":
     with app.app_context():
-        db.create_all()
+        # Creates missing tables and indexes, also on older databases;
+        # stops (without deleting anything) if titles need deduplicating
+        try:
+            upgrade_schema()
+        except DuplicateMoviesFound as exc:
+            raise SystemExit(str(exc)) from exc
 
     # For production (e.g. PythonAnywhere) debug should be disabled.
     app.run(debug=True)
@@ -0,0 +1,60 @@
+"""
+Bytes on the wire and latency of a 1,000-movie library, per content coding.
+
+    python benchmarks/bench_compression.py [movies]
+
+Serves the app with the werkzeug server and fetches the movie list page
+(HTML, the whole library on one page) and the JSON API list with
+Accept-Encoding identity, gzip and br (if the brotli package is
+installed). Prints body bytes, the best end-to-end time over loopback,
+and that time plus the transfer time of the body over a 10 Mbit/s link.
+"""
+
+import sys
+
+from common import fetch, insert_movies, load_app, serve
+
+REPEAT = 10
+LINK_BYTES_PER_MS = 10_000_000 / 8 / 1000
+
+
+def main():
+    """Fetch both pages with every content coding."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    app_module = load_app()
+    app_module.data_manager.movie_cache = None  # measure rendering, not the page cache
+    app = app_module.app
+    app.config["MOVIES_PAGE_SIZE"] = count
+    app.config["API_MAX_PAGE_SIZE"] = count
+
+    # pylint: disable=import-outside-toplevel
+    from http_compression import brotli
+
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+
+    with app.app_context():
+        user_id = app_module.data_manager.create_user("bench").id
+        insert_movies(app_module, user_id, count)
+
+    server = serve(app)
+    pages = {
+        "HTML": f"/users/{user_id}/movies",
+        "JSON": f"/api/v1/users/{user_id}/movies?limit={count}",
+    }
+    print(f"{count} movies on one page")
+    for label, path in pages.items():
+        for encoding in encodings:
+            fetch(server.server_port, path, encoding)
+            runs = [fetch(server.server_port, path, encoding) for _ in range(REPEAT)]
+            size = runs[0][2]
+            total = min(run[1] for run in runs)
+            print(
+                f"{label}  {encoding:<8} {size:>9} B   loopback {total:6.1f} ms   "
+                f"10 Mbit/s {total + size / LINK_BYTES_PER_MS:7.1f} ms"
+            )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
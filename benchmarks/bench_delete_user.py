@@ -0,0 +1,56 @@
+"""
+Deleting a user with a large library.
+
+    python benchmarks/bench_delete_user.py [movies]
+
+Compares DataManager.delete_user (set-based DELETEs) with deleting the
+same number of movies through the ORM one by one, reporting wall time
+and peak traced memory.
+"""
+
+import sys
+import time
+import tracemalloc
+
+from common import insert_movies, load_app
+
+
+def measure(function):
+    """Return (milliseconds, peak MB) of one call."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    function()
+    elapsed = (time.perf_counter() - started) * 1000
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    """Time deleting a large library set-based and per row."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    app_module = load_app()
+    from models import db, Movie, User  # pylint: disable=import-outside-toplevel
+
+    with app_module.app.app_context():
+        manager = app_module.data_manager
+        set_based = manager.create_user("set-based").id
+        per_row = manager.create_user("per-row").id
+        insert_movies(app_module, set_based, count)
+        insert_movies(app_module, per_row, count)
+        db.session.remove()
+
+        def delete_per_row():
+            for movie in Movie.query.filter_by(user_id=per_row).all():
+                db.session.delete(movie)
+            db.session.delete(db.session.get(User, per_row))
+            db.session.commit()
+
+        elapsed, peak = measure(lambda: manager.delete_user(set_based))
+        print(f"{count} movies, delete_user (set-based): {elapsed:8.0f} ms, peak {peak:6.1f} MB")
+        elapsed, peak = measure(delete_per_row)
+        print(f"{count} movies, ORM delete per row:      {elapsed:8.0f} ms, peak {peak:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Write throughput with and without group commit.
+
+    python benchmarks/bench_group_commit.py [clients] [writes_per_client]
+
+Many threads add movies concurrently, once with WRITE_BATCH_ENABLED off
+and once on, each in a fresh process (the setting is read when the app
+is imported).
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from common import load_app
+
+
+def run(clients, per_client):
+    """Measure the setting in the environment."""
+    app_module = load_app()
+    manager = app_module.data_manager
+    with app_module.app.app_context():
+        user_ids = [manager.create_user(f"user {n}").id for n in range(clients)]
+
+    errors = []
+
+    def client(user_id):
+        with app_module.app.app_context():
+            for index in range(per_client):
+                try:
+                    manager.add_movie(app_module.Movie(name=f"Movie {index}", user_id=user_id))
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    errors.append(exc)
+
+    threads = [threading.Thread(target=client, args=(user_id,)) for user_id in user_ids]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    batches = app_module.write_batcher.stats() if app_module.write_batcher else None
+    print(
+        f"group commit {'on ' if batches else 'off'}: "
+        f"{clients * per_client / elapsed:6.0f} writes/s, errors {len(errors)}"
+        + (f", avg batch {batches['avg_batch_size']}" if batches else "")
+    )
+
+
+def main():
+    """Run with group commit off and on in child processes, or one run as the child."""
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    per_client = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    if os.environ.get("BENCH_CHILD"):
+        run(clients, per_client)
+        return
+    for enabled in ("false", "true"):
+        env = dict(os.environ, BENCH_CHILD="1", WRITE_BATCH_ENABLED=enabled)
+        subprocess.run(
+            [sys.executable, __file__, str(clients), str(per_client)], env=env, check=True
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Render time and size of the movie list page.
+
+    python benchmarks/bench_movie_list_render.py [git-revision]
+
+Renders movies.html for 100, 1000 and 10000 movies and prints the time,
+bytes per movie and gzip size. With a git revision (e.g. the commit
+before a template change), that revision's movies.html is rendered too.
+"""
+
+import gzip
+import subprocess
+import sys
+
+from common import REPO_DIR, load_app, timed
+
+SIZES = (100, 1000, 10000)
+
+
+def template_at(revision):
+    """Return the source of templates/movies.html at a git revision."""
+    return subprocess.run(
+        ["git", "show", f"{revision}:templates/movies.html"],
+        cwd=REPO_DIR, check=True, capture_output=True, text=True,
+    ).stdout
+
+
+def main():
+    """Render each template at every library size."""
+    app_module = load_app()
+    # pylint: disable=import-outside-toplevel
+    from data_manager import MovieRecord, MoviePage
+    from user_cache import UserRecord
+
+    sources = {"current": (REPO_DIR / "templates" / "movies.html").read_text(encoding="utf-8")}
+    if len(sys.argv) > 1:
+        sources[sys.argv[1]] = template_at(sys.argv[1])
+    templates = {
+        name: app_module.app.jinja_env.from_string(source) for name, source in sources.items()
+    }
+    user = UserRecord(1, "alice")
+
+    for count in SIZES:
+        movies = [
+            MovieRecord(n, f"Movie title number {n}", "Some Director", 1950 + n % 70,
+                        f"https://img.example/posters/{n}.jpg")
+            for n in range(1, count + 1)
+        ]
+        page = MoviePage(movies, None, None)
+        # Both the current (page) and older (next_cursor/prev_cursor) variables
+        context = {
+            "user": user, "movies": movies, "page": page, "search": "",
+            "next_cursor": None, "prev_cursor": None,
+            "enrichment": {n: "done" for n in range(1, count + 1)},
+        }
+        with app_module.app.test_request_context(f"/users/{user.id}/movies"):
+            for name, template in templates.items():
+                html = template.render(**context).encode("utf-8")
+                elapsed = timed(
+                    lambda template=template, context=context: template.render(**context),
+                    repeat=max(1, 2000 // count),
+                )
+                print(
+                    f"{count:>6} movies  {name:<10} {elapsed:8.1f} ms  "
+                    f"{len(html) / count:6.0f} B/movie  gzip {len(gzip.compress(html, 6)):>9} B"
+                )
+
+
+if __name__ == "__main__":
+    main()
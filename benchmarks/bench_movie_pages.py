@@ -0,0 +1,57 @@
+"""
+Keyset vs OFFSET pagination of a large movie library.
+
+    python benchmarks/bench_movie_pages.py [movies]
+
+Prints the time to read one page of 50 movies at increasing depths with
+DataManager.get_movie_page (keyset cursors) and with LIMIT/OFFSET.
+"""
+
+import sys
+
+from common import insert_movies, load_app, timed
+
+PAGE_SIZE = 50
+
+
+def main():
+    """Time one page at increasing depths, keyset vs OFFSET."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    app_module = load_app()
+    app_module.data_manager.movie_cache = None  # measure the query, not the page cache
+    db = app_module.db
+    Movie = app_module.Movie
+
+    with app_module.app.app_context():
+        user_id = app_module.data_manager.create_user("bench").id
+        insert_movies(app_module, user_id, count)
+        first_id = db.session.execute(
+            db.select(db.func.min(Movie.id)).where(Movie.user_id == user_id)
+        ).scalar()
+
+        print(f"{count} movies, {PAGE_SIZE} per page")
+        for depth in (0, count // 2, count - PAGE_SIZE):
+            after = str(first_id + depth - 1) if depth else None
+
+            def keyset(after=after):
+                app_module.data_manager.get_movie_page(user_id, page_size=PAGE_SIZE, after=after)
+                db.session.expunge_all()
+
+            def offset(depth=depth):
+                (
+                    Movie.query.filter_by(user_id=user_id)
+                    .order_by(Movie.id)
+                    .offset(depth)
+                    .limit(PAGE_SIZE)
+                    .all()
+                )
+                db.session.expunge_all()
+
+            print(
+                f"row {depth:>7}: keyset {timed(keyset):7.2f} ms   "
+                f"offset {timed(offset):7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Search time of one user's library as other users' libraries grow.
+
+    python benchmarks/bench_search.py [movies-per-user]
+
+Adds users with the same kind of titles in steps (up to 1000 users) and
+prints the time of one user's search page with DataManager.get_movie_page
+(matched within the user inside FTS) and with a MATCH over every library
+joined to the user afterwards (the query before user_id was indexed).
+"""
+
+import sys
+
+from common import insert_movies, load_app, timed
+
+PAGE_SIZE = 50
+USER_STEPS = (1, 10, 100, 1000)
+SEARCHES = ("mov", "movie 12", "some dir")
+
+GLOBAL_MATCH = (
+    "SELECT movie.id FROM movie JOIN ("
+    "  SELECT rowid AS movie_id, bm25(movie_fts) AS rank FROM movie_fts"
+    "  WHERE movie_fts MATCH :match"
+    ") AS ranked ON ranked.movie_id = movie.id "
+    "WHERE movie.user_id = :user_id ORDER BY ranked.rank, movie.id LIMIT :limit"
+)
+
+
+def main():
+    """Time the searches at each number of users."""
+    per_user = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    app_module = load_app()
+    app_module.data_manager.movie_cache = None  # measure the query, not the page cache
+    db = app_module.db
+    # pylint: disable=import-outside-toplevel
+    from data_manager import fts_query
+
+    with app_module.app.app_context():
+        users = 0
+        for step in USER_STEPS:
+            while users < step:
+                users += 1
+                user_id = app_module.data_manager.create_user(f"user {users}").id
+                insert_movies(app_module, user_id, per_user)
+
+            print(f"{users} users x {per_user} movies")
+            for search in SEARCHES:
+                def scoped(search=search):
+                    app_module.data_manager.get_movie_page(1, search=search, page_size=PAGE_SIZE)
+                    db.session.expunge_all()
+
+                def global_match(search=search):
+                    db.session.execute(
+                        db.text(GLOBAL_MATCH),
+                        {"match": fts_query(search), "user_id": 1, "limit": PAGE_SIZE + 1},
+                    ).all()
+
+                print(
+                    f"  {search!r:<11} per user {timed(scoped, 10):8.2f} ms   "
+                    f"all libraries {timed(global_match, 3):8.2f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
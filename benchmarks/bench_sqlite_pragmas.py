@@ -0,0 +1,93 @@
+"""
+Concurrent reads and writes under different SQLite journal settings.
+
+    python benchmarks/bench_sqlite_pragmas.py [seconds]
+
+Runs 4 reader threads (movie list pages) and 2 writer threads (add
+movie) for a few seconds, once per journal_mode/synchronous pair, each
+in a fresh process (PRAGMAs are read when the app is imported).
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from common import insert_movies, load_app
+
+SETTINGS = [("WAL", "NORMAL"), ("DELETE", "FULL")]
+READERS = 4
+WRITERS = 2
+
+
+def run(seconds):
+    """Measure one setting (the one in the environment)."""
+    app_module = load_app()
+    app_module.data_manager.movie_cache = None
+    manager = app_module.data_manager
+    with app_module.app.app_context():
+        user_id = manager.create_user("bench").id
+        insert_movies(app_module, user_id, 5000)
+
+    stop = time.time() + seconds
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def count(name):
+        with lock:
+            counts[name] += 1
+
+    def reader():
+        while time.time() < stop:
+            with app_module.app.app_context():
+                try:
+                    manager.get_movie_page(user_id, page_size=50)
+                    count("reads")
+                except Exception:  # pylint: disable=broad-exception-caught
+                    count("errors")
+
+    def writer(number):
+        index = 0
+        while time.time() < stop:
+            with app_module.app.app_context():
+                try:
+                    manager.add_movie(app_module.Movie(name=f"w{number}-{index}", user_id=user_id))
+                    count("writes")
+                except Exception:  # pylint: disable=broad-exception-caught
+                    count("errors")
+            index += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(READERS)]
+    threads += [threading.Thread(target=writer, args=(n,)) for n in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(
+        f"journal_mode={os.environ['SQLITE_JOURNAL_MODE']:<6} "
+        f"synchronous={os.environ['SQLITE_SYNCHRONOUS']:<6} "
+        f"reads/s {counts['reads'] / seconds:8.0f}  writes/s {counts['writes'] / seconds:6.0f}  "
+        f"errors {counts['errors']}"
+    )
+
+
+def main():
+    """Run every configuration in a child process, or one run as the child."""
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    if os.environ.get("BENCH_CHILD"):
+        run(seconds)
+        return
+    for journal_mode, synchronous in SETTINGS:
+        env = dict(
+            os.environ,
+            BENCH_CHILD="1",
+            SQLITE_JOURNAL_MODE=journal_mode,
+            SQLITE_SYNCHRONOUS=synchronous,
+        )
+        subprocess.run([sys.executable, __file__, str(seconds)], env=env, check=True)
+
+
+if __name__ == "__main__":
+    main()
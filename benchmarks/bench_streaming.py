@@ -0,0 +1,56 @@
+"""
+Time to first byte of a large movie list page, buffered vs streamed.
+
+    python benchmarks/bench_streaming.py [movies ...]
+
+Serves the app with the werkzeug server and fetches one page holding the
+whole library (MOVIES_PAGE_SIZE = movies) with MOVIES_STREAMING off and
+on. Prints time to first byte, total time, body size and the server's
+peak traced memory, for identity and gzip responses.
+"""
+
+import sys
+import tracemalloc
+
+from common import fetch, insert_movies, load_app, serve
+
+REPEAT = 3
+
+
+def main():
+    """Fetch each library buffered and streamed, per content coding."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 20000]
+    app_module = load_app()
+    app_module.data_manager.movie_cache = None  # measure rendering, not the page cache
+    app = app_module.app
+
+    server = serve(app)
+
+    for count in sizes:
+        with app.app_context():
+            user_id = app_module.data_manager.create_user(f"user {count}").id
+            insert_movies(app_module, user_id, count)
+        app.config["MOVIES_PAGE_SIZE"] = count
+        path = f"/users/{user_id}/movies"
+
+        for streaming in (False, True):
+            app.config["MOVIES_STREAMING"] = streaming
+            for encoding in ("identity", "gzip"):
+                fetch(server.server_port, path, encoding)
+                runs = [fetch(server.server_port, path, encoding) for _ in range(REPEAT)]
+                tracemalloc.start()
+                fetch(server.server_port, path, encoding)
+                peak = tracemalloc.get_traced_memory()[1] / 1e6
+                tracemalloc.stop()
+                print(
+                    f"{count:>6} movies  {'streamed' if streaming else 'buffered'}  {encoding:<8} "
+                    f"ttfb {min(run[0] for run in runs):7.1f} ms  "
+                    f"total {min(run[1] for run in runs):7.0f} ms  "
+                    f"{runs[0][2]:>9} B  peak {peak:6.1f} MB"
+                )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
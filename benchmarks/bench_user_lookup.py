@@ -0,0 +1,53 @@
+"""
+Case-insensitive user lookup with and without the lower(name) index.
+
+    python benchmarks/bench_user_lookup.py [users]
+
+Times DataManager.get_user_by_name on a table of 1,000,000 users (by
+default) with ix_user_lower_name, then again after dropping it, and
+prints SQLite's query plan for both.
+"""
+
+import random
+import sys
+
+from common import load_app, timed
+
+LOOKUPS = 20
+
+
+def main():
+    """Time the lookups with and without the index."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    app_module = load_app()
+    db = app_module.db
+    data_manager = app_module.data_manager
+    names = [f"User {n}" for n in random.Random(1).sample(range(1, count + 1), LOOKUPS)]
+    plan_sql = "EXPLAIN QUERY PLAN SELECT id FROM user WHERE lower(name) = lower(?)"
+
+    with app_module.app.app_context():
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql(
+                "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < ?) "
+                "INSERT INTO user(name) SELECT 'User ' || x FROM n",
+                (count,),
+            )
+
+        def lookup():
+            for name in names:
+                assert data_manager.get_user_by_name(name.upper()) is not None
+            db.session.expunge_all()
+
+        print(f"{count} users, {LOOKUPS} lookups of upper-cased names")
+        for label in ("with ix_user_lower_name", "without index"):
+            with db.engine.begin() as connection:
+                plan = connection.exec_driver_sql(plan_sql, ("x",)).first()[-1]
+            per_lookup = timed(lookup, repeat=3) / LOOKUPS
+            print(f"{label:<24} {per_lookup:9.3f} ms per lookup   ({plan})")
+            # The next round runs without the index
+            with db.engine.begin() as connection:
+                connection.exec_driver_sql("DROP INDEX IF EXISTS ix_user_lower_name")
+
+
+if __name__ == "__main__":
+    main()
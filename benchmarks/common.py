@@ -0,0 +1,91 @@
+"""
+Shared set-up for the benchmark scripts.
+
+Every benchmark runs the app against a fresh SQLite database in a
+temporary directory (never data/movies.db) with OMDb disabled. Settings
+read at import time (SQLITE_*, WRITE_BATCH_*, ...) can be given as
+environment variables when running a script.
+"""
+
+import http.client
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+def load_app():
+    """
+    Import the app on a throw-away database and create its schema.
+
+    Returns:
+        module: The imported `app` module (app, data_manager, db, ...).
+    """
+    work_dir = tempfile.mkdtemp(prefix="moviweb-bench-")
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ["OMDB_API_KEY"] = ""
+    os.environ["DATABASE_PATH"] = os.path.join(work_dir, "movies.db")
+    os.environ["OMDB_LOCK_DIR"] = os.path.join(work_dir, "locks")
+    sys.path.insert(0, str(REPO_DIR))
+
+    # pylint: disable=import-outside-toplevel
+    import app as app_module
+    from migrate import upgrade_schema
+
+    with app_module.app.app_context():
+        upgrade_schema()
+    return app_module
+
+
+def insert_movies(app_module, user_id, count, prefix="Movie"):
+    """Insert `count` movies for a user with one set-based INSERT."""
+    with app_module.db.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < ?) "
+            "INSERT INTO movie(name, director, year, poster_url, user_id) "
+            "SELECT ? || ' ' || x, 'Some Director', 1950 + x % 70, "
+            "'https://img.example/' || x || '.jpg', ? FROM n",
+            (count, prefix, user_id),
+        )
+
+
+def timed(function, repeat=20):
+    """Return the mean wall time of `function` in milliseconds (after one warm-up call)."""
+    function()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def serve(app):
+    """Serve `app` with the werkzeug server in a background thread; return the server."""
+    # pylint: disable=import-outside-toplevel
+    from werkzeug.serving import make_server
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def fetch(port, path, encoding="identity"):
+    """Return (ttfb ms, total ms, body bytes) of one GET, discarding the body as it arrives."""
+    started = time.perf_counter()
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    connection.request("GET", path, headers={"Accept-Encoding": encoding})
+    response = connection.getresponse()
+    received = len(response.read1(65536))
+    first_byte = time.perf_counter() - started
+    while True:
+        chunk = response.read1(65536)
+        if not chunk:
+            break
+        received += len(chunk)
+    connection.close()
+    return first_byte * 1000, (time.perf_counter() - started) * 1000, received
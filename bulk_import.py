@@ -0,0 +1,108 @@
+"""
+Helpers for importing many movie titles at once.
+
+- parse_titles: read titles from a JSON array, a CSV file or a plain
+  newline-separated list (one title per line, commas included)
+- dedupe_titles: drop blank and repeated titles (case-insensitive)
+- lookup_titles: query OMDb for many titles concurrently with a
+  bounded thread pool
+"""
+
+import csv
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+from omdb_cache import normalize_title
+
+
+def parse_titles(json_data=None, text=None, is_csv=False):
+    """
+    Return the raw list of titles from a bulk import request.
+
+    Args:
+        json_data (list | None): Parsed JSON body – a list of strings or
+            of objects with a "title" key;
+        text (str | None): Newline-separated titles, each line taken as
+            is (titles may contain commas and quotes);
+        is_csv (bool): Parse `text` as CSV instead: only the first
+            column is used and a leading "title" header is skipped.
+
+    Returns:
+        list[str]: Titles in input order (not yet deduplicated).
+
+    Raises:
+        ValueError: If the JSON body is not a list.
+    """
+    if json_data is not None:
+        if not isinstance(json_data, list):
+            raise ValueError("Expected a JSON array of titles.")
+        titles = []
+        for item in json_data:
+            if isinstance(item, dict):
+                item = item.get("title")
+            if isinstance(item, str):
+                titles.append(item)
+        return titles
+
+    if not is_csv:
+        return (text or "").splitlines()
+
+    titles = []
+    for row in csv.reader(io.StringIO(text or "")):
+        if row:
+            titles.append(row[0])
+
+    if titles and titles[0].strip().lower() == "title":
+        titles = titles[1:]
+    return titles
+
+
+def dedupe_titles(titles):
+    """
+    Strip titles and drop blanks and case-insensitive repeats.
+
+    The first spelling of a title wins.
+
+    Returns:
+        list[str]: Unique, stripped titles in input order.
+    """
+    seen = set()
+    unique = []
+    for title in titles:
+        title = title.strip()
+        key = normalize_title(title)
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(title)
+    return unique
+
+
+def lookup_titles(app, client, titles, max_workers=10):
+    """
+    Look many titles up in OMDb concurrently.
+
+    Each lookup runs in its own app context (the client's caches use the
+    database session). Errors are returned, not raised, so one failing
+    title does not abort the import.
+
+    Args:
+        app (Flask): The application;
+        client (OMDbClient): Client used for the lookups;
+        titles (list[str]): Titles to look up;
+        max_workers (int): Max concurrent lookups.
+
+    Returns:
+        dict[str, dict | Exception]: title → OMDb response or the raised error.
+    """
+    def lookup(title):
+        with app.app_context():
+            try:
+                return client.lookup(title)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                return exc
+
+    if not titles:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(titles)))) as pool:
+        return dict(zip(titles, pool.map(lookup, titles)))
@@ -0,0 +1,174 @@
+"""
+Circuit breaker for calls to an unreliable upstream service.
+
+States:
+- closed:    calls go through; outcomes are recorded in a sliding window
+- open:      calls are rejected immediately until `open_duration` passes
+- half-open: a limited number of trial calls decide whether to close
+             again or re-open
+
+A call counts as failed if it raised or took longer than the slow-call
+threshold. One breaker instance is shared by all threads of a process.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name, failure_rate_threshold=0.5, slow_call_threshold=3.0,
+                 window_size=20, min_calls=5, open_duration=30.0,
+                 half_open_max_calls=1):
+        """
+        Args:
+            name (str): Name used in logs and metrics;
+            failure_rate_threshold (float): Share of failed calls (0–1) in the
+                window that opens the circuit;
+            slow_call_threshold (float): Seconds after which a successful call
+                still counts as a failure;
+            window_size (int): Number of recent calls considered;
+            min_calls (int): Calls needed in the window before it can open;
+            open_duration (float): Seconds to stay open before a trial call;
+            half_open_max_calls (int): Trial calls allowed while half-open.
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._window = deque(maxlen=window_size)  # True = failed call
+        self._state = self.CLOSED
+        self._opened_at = None
+        self._trial_calls = 0
+
+        self.rejected = 0
+        self.transitions = {self.OPEN: 0, self.HALF_OPEN: 0, self.CLOSED: 0}
+
+    @property
+    def state(self):
+        """Current state (an open circuit turns half-open once its timer ran out)."""
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    @property
+    def retry_at(self):
+        """Unix time at which an open circuit will let a trial call through."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return time.time()
+            return self._opened_at + self.open_duration
+
+    def allow_request(self):
+        """
+        Return True if a call may go to the upstream service now.
+
+        Callers that get True must report the outcome with
+        record_success() or record_failure().
+        """
+        with self._lock:
+            self._refresh()
+
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+                self._trial_calls += 1
+                return True
+
+            self.rejected += 1
+            return False
+
+    def release(self):
+        """
+        Give back a permission from allow_request() that went unused.
+
+        For callers that decide not to call after all (e.g. rate limited),
+        so a half-open trial slot is not held by a call that never ran.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._trial_calls > 0:
+                self._trial_calls -= 1
+
+    def record_success(self, duration):
+        """
+        Record a completed call.
+
+        Args:
+            duration (float): Call duration in seconds; slow calls count as failures.
+        """
+        if duration >= self.slow_call_threshold:
+            self.record_failure()
+            return
+
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._transition(self.CLOSED)
+                return
+            self._window.append(False)
+
+    def record_failure(self):
+        """Record a failed (or too slow) call."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._transition(self.OPEN)
+                return
+
+            self._window.append(True)
+            if self._state == self.CLOSED and self._should_open():
+                self._transition(self.OPEN)
+
+    def _should_open(self):
+        """Return True if the failure rate in the window exceeds the threshold."""
+        if len(self._window) < self.min_calls:
+            return False
+        return sum(self._window) / len(self._window) >= self.failure_rate_threshold
+
+    def _refresh(self):
+        """Move from open to half-open once the open period is over (lock held)."""
+        if self._state == self.OPEN and time.time() >= self._opened_at + self.open_duration:
+            self._transition(self.HALF_OPEN)
+
+    def _transition(self, state):
+        """Switch state, reset bookkeeping and log the change (lock held)."""
+        logger.warning("Circuit breaker '%s': %s -> %s", self.name, self._state, state)
+        self._state = state
+        self.transitions[state] += 1
+        self._trial_calls = 0
+
+        if state == self.OPEN:
+            self._opened_at = time.time()
+        elif state == self.CLOSED:
+            self._window.clear()
+            self._opened_at = None
+
+    def stats(self):
+        """Return state and counters as a plain dict."""
+        with self._lock:
+            self._refresh()
+            calls = len(self._window)
+            return {
+                "name": self.name,
+                "state": self._state,
+                "window_calls": calls,
+                "window_failure_rate": round(sum(self._window) / calls, 4) if calls else None,
+                "rejected": self.rejected,
+                "transitions": dict(self.transitions),
+                "retry_at": (
+                    self._opened_at + self.open_duration
+                    if self._state == self.OPEN else None
+                ),
+            }
@@ -4,21 +4,168 @@ Data Manager module for interacting with the database.
 Provides CRUD operations for:
 - Users
 - Movies
+- Background enrichment jobs
 using SQLAlchemy ORM.
 """
 
-from sqlalchemy import func
+import re
+import time
+from collections import namedtuple
 
-from models import db, User, Movie
+from sqlalchemy import func, literal_column, or_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+
+from models import db, User, Movie, EnrichmentJob, LibraryVersion, movie_fts
+from user_cache import UserRecord
+
+
+class DuplicateMovieError(Exception):
+    """Raised when a user already has a movie with the same title."""
+
+
+def is_duplicate_title(exc):
+    """
+    Return True if an IntegrityError is the unique title index firing.
+
+    Other violations (e.g. a foreign key to a missing user) are not
+    duplicates and must not be reported as such.
+    """
+    return "UNIQUE constraint failed" in str(exc.orig)
+
+
+def fts_query(search):
+    """
+    Turn free text into a safe FTS5 prefix query.
+
+    Every word must match the start of a word in the title or director:
+    "dark kni" → '"dark"* "kni"*'. Quoting keeps FTS5 operators and
+    punctuation in user input from being interpreted.
+
+    Returns:
+        str | None: The MATCH expression, or None if there are no words.
+    """
+    words = re.findall(r"\w+", search)
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+# One page of a keyset-paginated movie list. The cursors are opaque
+# strings (None when there is no next/previous page).
+MoviePage = namedtuple("MoviePage", ["movies", "next_cursor", "prev_cursor"])
+UserPage = namedtuple("UserPage", ["users", "next_cursor", "prev_cursor"])
+
+# A movie as served from the movie list cache (same attributes as Movie)
+MovieRecord = namedtuple("MovieRecord", ["id", "name", "director", "year", "poster_url"])
+
+
+class MovieStream:
+    """
+    One page of movies produced while it is being iterated.
+
+    Templates render the page links after the list, so next_cursor and
+    prev_cursor only need to be known once the movies have been
+    iterated. Enrichment statuses are loaded per chunk into `statuses`
+    before the chunk's movies are yielded.
+    """
+
+    def __init__(self, rows, page_size, has_prev, chunk_size, status_loader):
+        """
+        Args:
+            rows: Streaming query of page_size + 1 rows;
+            page_size (int): Movies per page;
+            has_prev (bool): Whether a previous page exists;
+            chunk_size (int): Movies per status lookup;
+            status_loader (callable): movie IDs → {movie_id: status}.
+        """
+        self._rows = rows
+        self.page_size = page_size
+        self.has_prev = has_prev
+        self.chunk_size = chunk_size
+        self.status_loader = status_loader
+
+        self.statuses = {}
+        self.next_cursor = None
+        self.prev_cursor = None
+
+    def __iter__(self):
+        chunk = []
+        last = None
+        for count, row in enumerate(self._rows):
+            if count == self.page_size:
+                # The extra row only tells us that a next page exists
+                self.next_cursor = encode_cursor((last.id,))
+                break
+            if count == 0 and self.has_prev:
+                self.prev_cursor = encode_cursor((row.id,))
+            chunk.append(row)
+            last = row
+            if len(chunk) == self.chunk_size:
+                yield from self._flush(chunk)
+                chunk = []
+        yield from self._flush(chunk)
+
+    def _flush(self, movies):
+        """Load the enrichment statuses of a chunk, then yield its movies."""
+        # Refilled in place: the template holds on to this dict
+        self.statuses.clear()
+        self.statuses.update(self.status_loader([movie.id for movie in movies]))
+        yield from movies
+
+
+def encode_cursor(values):
+    """Encode the sort key of a row as a URL-safe cursor string."""
+    return "~".join(repr(value) for value in values)
+
+
+def decode_cursor(cursor, size):
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Every part is an ID (cursors are the IDs of boundary rows).
+
+    Returns:
+        tuple | None: The sort key, or None if the cursor is invalid.
+    """
+    if not cursor:
+        return None
+
+    parts = cursor.split("~")
+    if len(parts) != size:
+        return None
+
+    try:
+        return tuple(int(part) for part in parts)
+    except ValueError:
+        return None
 
 
 class DataManager:
     """Data access layer for users and movies."""
 
+    def __init__(self, writer=None, user_cache=None, movie_cache=None):
+        """
+        Args:
+            writer (GroupCommitWriter | None): If given, user and movie
+                writes are committed in batches by its writer thread;
+            user_cache (UserCache | None): If given, get_user is served
+                from it and user writes invalidate it;
+            movie_cache (MovieListCache | None): If given, get_movie_page
+                is served from it (pages are keyed by library version).
+        """
+        self.writer = writer
+        self.user_cache = user_cache
+        self.movie_cache = movie_cache
+        self._fts_ready = False
+
     def get_user_by_name(self, name):
         """
         Return a user by name (case-insensitive), or None if not found.
 
+        The filter matches the lower(name) expression index exactly,
+        so this is an index seek rather than a table scan.
+
         Args:
             name (str): The user's name to search for.
         """
@@ -32,142 +179,810 @@ class DataManager:
             name (str): Name of the new user.
         """
         new_user = User(name=name)
-        db.session.add(new_user)
-        db.session.commit()
+
+        def insert():
+            db.session.add(new_user)
+            db.session.flush()
+            if self.user_cache is not None:
+                self.user_cache.bump_version()
+            self._bump_library_version(new_user.id)
+            return new_user
+
+        new_user = self._write(insert)
+        if self.user_cache is not None:
+            # SQLite may reuse the ID of a deleted user
+            self.user_cache.invalidate(new_user.id)
         return new_user
 
-    def get_users(self):
-        """Return a list of all users in the database."""
-        return User.query.all()
+    def get_user_page(self, page_size=50, after=None, before=None, with_counts=True):
+        """
+        Return one page of users with their movie counts.
+
+        Uses keyset pagination on the user ID. Each count is a correlated
+        subquery evaluated only for the users on the page (an index range
+        count on movie(user_id, id)), so the cost does not grow with the
+        number of users or movies.
+
+        Args:
+            page_size (int): Users per page.
+            after (str | None): Cursor of the last user of the previous page.
+            before (str | None): Cursor of the first user of the next page.
+            with_counts (bool): Whether to count each user's movies.
+
+        Returns:
+            UserPage: rows with id, name and (with_counts) movie_count,
+            plus cursors.
+        """
+        columns = [User.id, User.name]
+        if with_counts:
+            columns.append(self._movie_count_column())
+        query = db.session.query(*columns)
+
+        after_key = decode_cursor(after, 1)
+        before_key = decode_cursor(before, 1) if after_key is None else None
+
+        if before_key is not None:
+            rows = (
+                query.filter(User.id < before_key[0])
+                .order_by(User.id.desc())
+                .limit(page_size + 1)
+                .all()
+            )
+            has_prev = len(rows) > page_size
+            rows = rows[:page_size][::-1]
+            has_next = True
+        else:
+            if after_key is not None:
+                query = query.filter(User.id > after_key[0])
+            rows = query.order_by(User.id).limit(page_size + 1).all()
+            has_next = len(rows) > page_size
+            rows = rows[:page_size]
+            has_prev = after_key is not None
+
+        if not rows:
+            return UserPage([], None, None)
+
+        return UserPage(
+            rows,
+            encode_cursor((rows[-1].id,)) if has_next else None,
+            encode_cursor((rows[0].id,)) if has_prev else None,
+        )
+
+    def _movie_count_column(self):
+        """Return a labeled correlated subquery counting a user's movies."""
+        return (
+            db.select(func.count(Movie.id))
+            .where(Movie.user_id == User.id)
+            .scalar_subquery()
+            .label("movie_count")
+        )
+
+    def get_movie_count(self, user_id):
+        """Return how many movies a user has (an index range count)."""
+        return db.session.execute(
+            db.select(func.count(Movie.id)).where(Movie.user_id == user_id)
+        ).scalar()
 
     def get_user(self, user_id):
         """
         Return a single user by ID, or None if not found.
 
+        Served from the user cache when one is configured; otherwise a
+        primary-key SELECT of the id and name columns.
+
         Args:
             user_id (int): The ID of the user.
+
+        Returns:
+            UserRecord | None: The user's id and name.
         """
-        return User.query.get(user_id)
+        if self.user_cache is not None:
+            record = self.user_cache.get(user_id)
+            if record is not None:
+                return record
+
+        row = db.session.execute(
+            db.select(User.id, User.name).where(User.id == user_id)
+        ).first()
+        if row is None:
+            return None
+
+        record = UserRecord(*row)
+        if self.user_cache is not None:
+            self.user_cache.set(record)
+        return record
 
-    def get_movies(self, user_id, search=None):
+    def _write(self, operation):
+        """
+        Run a write operation (no commit inside) and commit it.
+
+        With a group-commit writer the operation is queued and committed
+        together with concurrent writes; otherwise it runs in the
+        caller's session and is committed at once.
+
+        Returns:
+            The operation's return value.
         """
-        Return a list of all movies belonging to a specific user.
+        if self.writer is not None:
+            return self.writer.run(operation)
+
+        try:
+            result = operation()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        return result
+
+    def has_search_index(self):
+        """Return True if the movie_fts full-text index exists (with user_id)."""
+        if not self._fts_ready:
+            self._fts_ready = db.session.execute(
+                db.text(
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE name = 'movie_fts' AND sql LIKE '%user_id%'"
+                )
+            ).first() is not None
+        return self._fts_ready
+
+    def _movies_query(self, user_id, search=None, columns=None):
+        """
+        Build the query behind the movie page methods.
+
+        If 'search' is provided, movies are matched by word prefixes in the
+        title or director through the movie_fts full-text index, with a
+        BM25 relevance rank. Without FTS5 support it falls back to a
+        case-insensitive substring match on the title.
 
-        If 'search' is provided, filter movies by title (case-insensitive).
+        The match is narrowed to the user inside FTS (the owner's ID is an
+        indexed column), so it walks this user's matches only. BM25 still
+        reads index-wide term statistics, and prefixes longer than the
+        prefix indexes merge every library's matches, so a word common to
+        all libraries costs more as the database grows
+        (see benchmarks/bench_search.py).
 
         Args:
-            user_id (int): The owner user ID.
-            search (str | None): Optional search term for movie title.
+            user_id (int): The owner user ID;
+            search (str | None): Optional search term;
+            columns (list | None): Movie columns to select instead of
+                whole Movie instances.
 
         Returns:
-            list[Movie]: Movies belonging to the user (possibly filtered).
+            tuple: (query, rank). Rows are Movie instances (or rows of the
+            given columns), plus a trailing rank column when the full-text
+            index is used; rank is that column, or None.
         """
-        query = Movie.query.filter_by(user_id=user_id)
+        query = (
+            db.session.query(*columns) if columns else Movie.query
+        ).filter(Movie.user_id == user_id)
+
+        if not search:
+            return query, None
+
+        match = fts_query(search)
+        if match is None or not self.has_search_index():
+            # No words to match, or no FTS5 (migrate.py not run yet)
+            return query.filter(Movie.name.ilike(f"%{search}%")), None
+
+        # Matched within the user's movies in FTS, not across every library
+        match = f'user_id : "{int(user_id)}" AND {{name director}} : ({match})'
+        fts = literal_column("movie_fts")
+        ranked = (
+            db.select(
+                movie_fts.c.rowid.label("movie_id"),
+                # The user_id column only narrows the match, it scores nothing
+                func.bm25(fts, 1.0, 1.0, 0.0).label("rank"),
+            )
+            .where(fts.op("MATCH")(match))
+            .subquery()
+        )
+        query = (
+            query.join(ranked, ranked.c.movie_id == Movie.id)
+            .add_columns(ranked.c.rank)
+        )
+        return query, ranked.c.rank
+
+    def get_movie_page(self, user_id, search=None, page_size=50, after=None,
+                       before=None, version=None):
+        """
+        Return one page of a user's movies using keyset pagination.
 
-        if search:
-            query = query.filter(Movie.name.ilike(f"%{search}%"))
+        Pages are addressed by the movie ID of their boundary row, not by
+        offset, so every page costs the same index seek however deep the
+        user pages. Search results are paged by ID too and only ordered by
+        relevance within a page: BM25 ranks shift whenever any library
+        changes, so a rank cursor would skip or repeat movies. With a
+        movie list cache the page is served from it and the movies are
+        MovieRecord tuples.
 
-        return query.all()
+        Args:
+            user_id (int): The owner user ID.
+            search (str | None): Optional search term (see _movies_query).
+            page_size (int): Movies per page.
+            after (str | None): Cursor of the last row of the previous page.
+            before (str | None): Cursor of the first row of the next page
+                (for paging backwards).
+            version (int | None): The library version the caller already
+                read (e.g. for an ETag), so the cached page matches it;
+                read here if None.
 
-    def movie_exists_for_user(self, user_id, title):
+        Returns:
+            MoviePage: movies plus next/prev cursors.
         """
-        Check if a movie with this title already exists for the given user.
+        if self.movie_cache is None:
+            return self._query_movie_page(user_id, search, page_size, after, before)
+
+        def load():
+            page = self._query_movie_page(user_id, search, page_size, after, before)
+            return {
+                "movies": [
+                    [getattr(movie, field) for field in MovieRecord._fields]
+                    for movie in page.movies
+                ],
+                "next_cursor": page.next_cursor,
+                "prev_cursor": page.prev_cursor,
+            }
+
+        if version is None:
+            row = self.get_library_version(user_id)
+            version = row.version if row else 0
+        data = self.movie_cache.get_or_load(
+            user_id, version, [page_size, after, before, search], load
+        )
+        return MoviePage(
+            [MovieRecord(*values) for values in data["movies"]],
+            data["next_cursor"],
+            data["prev_cursor"],
+        )
+
+    def get_movie_rows(self, user_id, fields, search=None, page_size=50, after=None,
+                       before=None):
+        """
+        Return one page of a user's movies as plain rows of some columns.
 
-        The check is case-insensitive and ignores leading/trailing spaces.
+        Same order and cursors as get_movie_page, but only the requested
+        columns are selected and no Movie instances are built, so
+        serializing a page costs little more than reading it.
 
         Args:
             user_id (int): The owner user ID.
-            title (str): Movie title to check.
+            fields (list[str]): MovieRecord fields to select besides the ID.
+            search (str | None): Optional search term (see _movies_query).
+            page_size (int): Movies per page.
+            after (str | None): Cursor of the last row of the previous page.
+            before (str | None): Cursor of the first row of the next page.
 
         Returns:
-            bool: True if a matching movie exists, False otherwise.
+            MoviePage: rows of (id, *fields), plus cursors.
+        """
+        columns = [Movie.id] + [getattr(Movie, field) for field in fields if field != "id"]
+        return self._query_movie_page(user_id, search, page_size, after, before, columns)
+
+    def get_movie_row(self, user_id, movie_id, fields):
         """
-        if not title:
-            return False
+        Return one of a user's movies as a plain row, or None if not found.
 
-        normalized = title.strip()
-        if not normalized:
-            return False
+        Args:
+            user_id (int): The owner user ID.
+            movie_id (int): The movie ID.
+            fields (list[str]): MovieRecord fields to select besides the ID.
 
-        existing = Movie.query.filter(
-            Movie.user_id == user_id,
-            func.lower(Movie.name) == func.lower(normalized),
+        Returns:
+            Row | None: (id, *fields).
+        """
+        columns = [Movie.id] + [getattr(Movie, field) for field in fields if field != "id"]
+        return db.session.execute(
+            db.select(*columns).where(Movie.id == movie_id, Movie.user_id == user_id)
         ).first()
 
-        return existing is not None
+    def _query_movie_page(self, user_id, search, page_size, after, before, columns=None):
+        """Run the keyset page query behind get_movie_page/get_movie_rows."""
+        query, rank = self._movies_query(user_id, search, columns)
+
+        after_key = decode_cursor(after, 1)
+        before_key = decode_cursor(before, 1) if after_key is None else None
+
+        if before_key is not None:
+            # Walk backwards from the cursor, then restore the normal order
+            rows = (
+                query.filter(Movie.id < before_key[0])
+                .order_by(Movie.id.desc())
+                .limit(page_size + 1)
+                .all()
+            )
+            has_prev = len(rows) > page_size
+            rows = rows[:page_size][::-1]
+            has_next = True
+        else:
+            if after_key is not None:
+                query = query.filter(Movie.id > after_key[0])
+            rows = query.order_by(Movie.id).limit(page_size + 1).all()
+            has_next = len(rows) > page_size
+            rows = rows[:page_size]
+            has_prev = after_key is not None
+
+        if not rows:
+            return MoviePage([], None, None)
+
+        def movie_id(row):
+            if rank is None or columns:
+                return row.id
+            return row[0].id
+
+        next_cursor = encode_cursor((movie_id(rows[-1]),)) if has_next else None
+        prev_cursor = encode_cursor((movie_id(rows[0]),)) if has_prev else None
+        if rank is not None:
+            # Most relevant first within the page (rank is the last column)
+            rows = sorted(rows, key=lambda row: (row[-1], movie_id(row)))
+            rows = [row[:-1] if columns else row[0] for row in rows]
+        return MoviePage(rows, next_cursor, prev_cursor)
+
+    def stream_movie_page(self, user_id, page_size=50, after=None, chunk_size=100):
+        """
+        Return one page of a user's movies that is read while it is iterated.
+
+        Same order and cursors as get_movie_page (forward paging only, no
+        search: search pages are reordered by relevance, so they need all
+        their rows first), but the rows come from the database chunk_size
+        at a time through a streaming cursor (yield_per), so a streamed
+        response can send the first movies at once and memory stays flat
+        for huge pages.
+
+        Args:
+            user_id (int): The owner user ID.
+            page_size (int): Movies per page.
+            after (str | None): Cursor of the last row of the previous page.
+            chunk_size (int): Rows fetched per round-trip.
+
+        Returns:
+            MovieStream: Iterable of movies; cursors and enrichment
+            statuses are filled in as it is consumed.
+        """
+        query, _rank = self._movies_query(user_id)
+
+        after_key = decode_cursor(after, 1)
+        if after_key is not None:
+            query = query.filter(Movie.id > after_key[0])
+
+        rows = query.order_by(Movie.id).limit(page_size + 1).yield_per(chunk_size)
+        return MovieStream(
+            rows,
+            page_size,
+            has_prev=after_key is not None,
+            chunk_size=chunk_size,
+            status_loader=self.get_enrichment_statuses,
+        )
+
+    def get_existing_titles(self, user_id, titles):
+        """
+        Return which of the given titles the user already has.
+
+        One query per 500 titles instead of one per title.
+
+        Args:
+            user_id (int): The owner user ID.
+            titles (list[str]): Candidate titles.
+
+        Returns:
+            set[str]: Lowercased names of the matching movies.
+        """
+        lowered = sorted({title.strip().lower() for title in titles if title.strip()})
+        existing = set()
+
+        for start in range(0, len(lowered), 500):
+            chunk = lowered[start:start + 500]
+            rows = (
+                db.session.query(Movie.name)
+                .filter(
+                    Movie.user_id == user_id,
+                    func.lower(Movie.name).in_(chunk),
+                )
+                .all()
+            )
+            existing.update(row.name.lower() for row in rows)
+
+        return existing
 
     def add_movie(self, movie):
         """
         Add a new movie to a user's favorites.
 
         Expects 'movie' to be a Movie instance
-        with all fields already set.
+        with all fields already set. Title uniqueness per user is
+        enforced by the database, so no read-before-write is needed.
 
         Args:
             movie (Movie): The movie to add.
 
         Returns:
             Movie: The persisted Movie instance.
+
+        Raises:
+            DuplicateMovieError: If the user already has this title.
         """
-        db.session.add(movie)
-        db.session.commit()
+        def insert():
+            db.session.add(movie)
+            db.session.flush()
+            self._bump_library_version(movie.user_id)
+            return movie
+
+        try:
+            movie = self._write(insert)
+        except IntegrityError as exc:
+            if not is_duplicate_title(exc):
+                raise
+            raise DuplicateMovieError(movie.name) from exc
         return movie
 
-    def update_movie(self, movie_id, title=None, year=None, director=None):
+    def add_movies(self, movies):
+        """
+        Add many movies in a single transaction.
+
+        If the batch hits the unique title constraint (e.g. a concurrent
+        add), it is retried row by row and the duplicates are skipped.
+
+        Args:
+            movies (list[Movie]): Movie instances with all fields set.
+
+        Returns:
+            list[Movie]: The persisted movies (with IDs).
+        """
+        session = db.session()
+        try:
+            session.add_all(movies)
+            session.flush()
+        except IntegrityError:
+            session.rollback()
+            saved = []
+            for movie in movies:
+                try:
+                    with session.begin_nested():
+                        session.add(movie)
+                    saved.append(movie)
+                except IntegrityError as exc:
+                    if not is_duplicate_title(exc):
+                        session.rollback()
+                        raise
+            movies = saved
+
+        user_ids = {movie.user_id for movie in movies}
+        for user_id in user_ids:
+            self._bump_library_version(user_id)
+
+        # Keep the new rows loaded after the commit: callers read their IDs
+        # and names, which would otherwise cost one SELECT per movie.
+        session.expire_on_commit = False
+        try:
+            session.commit()
+        finally:
+            session.expire_on_commit = True
+        return movies
+
+    def update_movie(self, user_id, movie_id, title=None, year=None,
+                     director=None, poster_url=None):
         """
-        Update the fields of a movie.
+        Update the fields of a movie owned by a user.
+
+        The movie is matched on both ID and owner, so a user can never
+        change another user's movie.
 
         Parameters may be:
         - title: str or None
         - year: int or None
         - director: str or None
+        - poster_url: str or None
 
-        Empty strings are ignored.
+        Empty strings are ignored. Runs as a single
+        UPDATE ... WHERE id = ? AND user_id = ? RETURNING ... whose SET
+        clause holds only the given fields, so an edit is one round-trip.
 
         Returns:
-            Movie | None: The updated movie, or None if not found.
-        """
-        movie = Movie.query.get(movie_id)
-        if movie is None:
-            return None
+            Row | None: The updated movie's columns (id, name, director,
+            year, poster_url, user_id), or None if the user has no such
+            movie.
 
+        Raises:
+            DuplicateMovieError: If the new title is already in the library.
+        """
+        values = {}
         if title:
-            movie.name = title
+            values["name"] = title
         if year is not None:
-            movie.year = year
+            values["year"] = year
         if director:
-            movie.director = director
+            values["director"] = director
+        if poster_url:
+            values["poster_url"] = poster_url
+
+        columns = (
+            Movie.id, Movie.name, Movie.director,
+            Movie.year, Movie.poster_url, Movie.user_id,
+        )
+
+        if not values:
+            # Nothing to change: keep the None-if-missing contract
+            return db.session.execute(
+                db.select(*columns).where(Movie.id == movie_id, Movie.user_id == user_id)
+            ).first()
+
+        def change():
+            row = db.session.execute(
+                update(Movie)
+                .where(Movie.id == movie_id, Movie.user_id == user_id)
+                .values(**values)
+                .returning(*columns),
+                execution_options={"synchronize_session": False},
+            ).first()
+            if row is not None:
+                self._bump_library_version(user_id)
+            return row
+
+        try:
+            row = self._write(change)
+        except IntegrityError as exc:
+            if not is_duplicate_title(exc):
+                raise
+            raise DuplicateMovieError(title) from exc
+        return row
+
+    def delete_movie(self, user_id, movie_id):
+        """
+        Delete a movie owned by a user, together with its enrichment jobs.
 
-        db.session.commit()
-        return movie
+        Both DELETEs match on ID and owner, so a user can never remove
+        another user's movie.
+
+        Returns:
+            int: Number of deleted movies (0 if the user has no such movie).
+        """
+        def remove():
+            # Databases created before ON DELETE CASCADE need the explicit delete
+            db.session.execute(
+                db.delete(EnrichmentJob).where(
+                    EnrichmentJob.movie_id == movie_id,
+                    EnrichmentJob.user_id == user_id,
+                ),
+                execution_options={"synchronize_session": False},
+            )
+            deleted = db.session.execute(
+                db.delete(Movie).where(Movie.id == movie_id, Movie.user_id == user_id)
+            ).rowcount
+            if deleted:
+                self._bump_library_version(user_id)
+            return deleted
+
+        return self._write(remove)
+
+    def delete_user(self, user_id):
+        """
+        Delete a user and all their movies.
+
+        Uses set-based DELETE statements instead of loading the user's
+        movies into the session and deleting them one by one, so the
+        cost is a few index range deletes however large the library is.
+
+        Returns:
+            bool: True if the user existed and was deleted, False otherwise.
+        """
+        def remove():
+            # ON DELETE CASCADE covers new databases; the explicit deletes
+            # keep databases created before it consistent.
+            movie_ids = db.select(Movie.id).where(Movie.user_id == user_id)
+            db.session.execute(
+                db.delete(EnrichmentJob).where(EnrichmentJob.movie_id.in_(movie_ids)),
+                execution_options={"synchronize_session": False},
+            )
+            db.session.execute(db.delete(Movie).where(Movie.user_id == user_id))
+            deleted = db.session.execute(db.delete(User).where(User.id == user_id)).rowcount
+            if deleted:
+                if self.user_cache is not None:
+                    self.user_cache.bump_version()
+                self._bump_library_version(user_id)
+            return deleted
+
+        deleted = self._write(remove) > 0
+        if self.user_cache is not None:
+            self.user_cache.invalidate(user_id)
+        return deleted
+
+    def _bump_library_version(self, user_id):
+        """
+        Increment a user's library version in the current transaction.
+
+        Called by every write that changes what the movie list shows, so
+        the version (and the ETag built from it) changes with the page.
+        """
+        now = time.time()
+        db.session.execute(
+            sqlite_insert(LibraryVersion)
+            .values(user_id=user_id, version=1, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=[LibraryVersion.user_id],
+                set_={"version": LibraryVersion.version + 1, "updated_at": now},
+            )
+        )
+
+    def get_library_version(self, user_id):
+        """
+        Return the version of a user's library: one primary-key lookup.
+
+        Returns:
+            Row | None: (version, updated_at), or None if the library has
+            never been written since versions were introduced.
+        """
+        return db.session.execute(
+            db.select(LibraryVersion.version, LibraryVersion.updated_at)
+            .where(LibraryVersion.user_id == user_id)
+        ).first()
 
-    def delete_movie(self, movie_id):
+    def create_enrichment_job(self, movie, run_after=None):
         """
-        Delete a movie by ID.
+        Queue a background OMDb lookup for a movie.
+
+        Args:
+            movie (Movie): A persisted movie (title only);
+            run_after (float | None): Unix time before which the job
+                must not run (defaults to now).
 
         Returns:
-            bool: True if deleted, False if movie not found.
+            EnrichmentJob: The persisted job.
         """
-        movie = Movie.query.get(movie_id)
-        if movie is None:
-            return False
+        return self.create_enrichment_jobs([movie], run_after=run_after)[0]
+
+    def create_enrichment_jobs(self, movies, run_after=None):
+        """
+        Queue background OMDb lookups for many movies in one transaction.
+
+        Args:
+            movies (list[Movie]): Persisted movies (title only);
+            run_after (float | None): Unix time before which the jobs
+                must not run (defaults to now).
 
-        db.session.delete(movie)
+        Returns:
+            list[EnrichmentJob]: The persisted jobs.
+        """
+        now = time.time()
+        jobs = [
+            EnrichmentJob(
+                movie_id=movie.id,
+                user_id=movie.user_id,
+                title=movie.name,
+                status=EnrichmentJob.PENDING,
+                attempts=0,
+                run_after=run_after if run_after is not None else now,
+                created_at=now,
+                updated_at=now,
+            )
+            for movie in movies
+        ]
+        db.session.add_all(jobs)
+        for user_id in {job.user_id for job in jobs}:
+            self._bump_library_version(user_id)
         db.session.commit()
-        return True
+        return jobs
 
-    def delete_user(self, user_id):
+    def get_enrichment_job(self, job_id):
+        """Return an enrichment job by ID, or None if not found."""
+        return db.session.get(EnrichmentJob, job_id)
+
+    def get_due_enrichment_job_ids(self, stale_after, limit=50):
         """
-        Delete a user and all their movies.
+        Return IDs of jobs that are ready to run.
+
+        A job is due if it is pending and its run_after time has passed,
+        or if it has been "running" for longer than `stale_after` seconds
+        (its worker most likely died).
+
+        Args:
+            stale_after (float): Seconds after which a running job is retried;
+            limit (int): Max number of IDs to return.
 
         Returns:
-            bool: True if the user existed and was deleted, False otherwise.
+            list[int]: Job IDs, oldest first.
         """
-        user = User.query.get(user_id)
-        if user is None:
-            return False
+        now = time.time()
+        rows = (
+            db.session.query(EnrichmentJob.id)
+            .filter(
+                or_(
+                    (EnrichmentJob.status == EnrichmentJob.PENDING)
+                    & (EnrichmentJob.run_after <= now),
+                    (EnrichmentJob.status == EnrichmentJob.RUNNING)
+                    & (EnrichmentJob.updated_at <= now - stale_after),
+                )
+            )
+            .order_by(EnrichmentJob.run_after)
+            .limit(limit)
+            .all()
+        )
+        return [row.id for row in rows]
+
+    def claim_enrichment_job(self, job_id, stale_after):
+        """
+        Atomically mark a due job as running.
+
+        The conditional UPDATE makes the claim safe across threads and
+        worker processes: only one of them gets rowcount == 1.
 
-        # Movies are removed via cascade="all, delete" defined on the relationship
-        db.session.delete(user)
+        Returns:
+            bool: True if this caller now owns the job.
+        """
+        now = time.time()
+        claimed = EnrichmentJob.query.filter(
+            EnrichmentJob.id == job_id,
+            or_(
+                (EnrichmentJob.status == EnrichmentJob.PENDING)
+                & (EnrichmentJob.run_after <= now),
+                (EnrichmentJob.status == EnrichmentJob.RUNNING)
+                & (EnrichmentJob.updated_at <= now - stale_after),
+            ),
+        ).update(
+            {
+                EnrichmentJob.status: EnrichmentJob.RUNNING,
+                EnrichmentJob.attempts: EnrichmentJob.attempts + 1,
+                EnrichmentJob.updated_at: now,
+            },
+            synchronize_session=False,
+        )
+        db.session.commit()
+        return claimed == 1
+
+    def finish_enrichment_job(self, job_id, status, error=None, run_after=None,
+                              count_attempt=True):
+        """
+        Record the outcome of an enrichment attempt.
+
+        Args:
+            job_id (int): The job ID;
+            status (str): New status (pending to retry, done or failed);
+            error (str | None): Short error description;
+            run_after (float | None): Next attempt time for retried jobs;
+            count_attempt (bool): False if the attempt never reached OMDb
+                and must not count towards the attempt limit.
+        """
+        job = db.session.get(EnrichmentJob, job_id)
+        if job is None:
+            return
+
+        if not count_attempt:
+            job.attempts = max(job.attempts - 1, 0)
+        job.status = status
+        job.error = error[:200] if error else None
+        job.updated_at = time.time()
+        if run_after is not None:
+            job.run_after = run_after
+        # The movie list shows the job status
+        self._bump_library_version(job.user_id)
         db.session.commit()
-        return True
+
+    def get_enrichment_statuses(self, movie_ids):
+        """
+        Return the latest enrichment status of each of the given movies.
+
+        Only movies that have had a job appear in the result.
+
+        Args:
+            movie_ids (list[int]): Movies to look up (e.g. one page).
+
+        Returns:
+            dict[int, str]: movie_id → job status.
+        """
+        if not movie_ids:
+            return {}
+
+        rows = (
+            db.session.query(EnrichmentJob.movie_id, EnrichmentJob.status)
+            .filter(EnrichmentJob.movie_id.in_(movie_ids))
+            .order_by(EnrichmentJob.id)
+            .all()
+        )
+        return {row.movie_id: row.status for row in rows}
+
+    def get_enrichment_counts(self):
+        """Return the number of enrichment jobs per status."""
+        rows = (
+            db.session.query(EnrichmentJob.status, func.count(EnrichmentJob.id))
+            .group_by(EnrichmentJob.status)
+            .all()
+        )
+        return dict(rows)
@@ -0,0 +1,205 @@
+"""
+Background enrichment of movies with OMDb metadata.
+
+In asynchronous mode a movie is saved with its title only and an
+EnrichmentJob row is queued. A small thread pool later looks the title
+up in OMDb and fills in director, year and poster via the DataManager.
+
+The job table lives in SQLite, so jobs survive restarts and several
+worker processes can share the queue: claiming a job is a single
+conditional UPDATE, so each job runs only once.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from models import EnrichmentJob
+from omdb_client import OMDbUnavailableError, movie_fields
+
+logger = logging.getLogger(__name__)
+
+
+class EnrichmentWorker:
+    """Thread pool that runs queued OMDb enrichment jobs."""
+
+    def __init__(self, app, client, data_manager, max_workers=2,
+                 poll_interval=5.0, max_attempts=5, retry_delay=60.0,
+                 stale_after=600.0):
+        """
+        Args:
+            app (Flask): Application (jobs run inside its app context);
+            client (OMDbClient): Client used for the lookups;
+            data_manager (DataManager): Data access layer;
+            max_workers (int): Threads running jobs in parallel;
+            poll_interval (float): Seconds between scans for due jobs;
+            max_attempts (int): Attempts before a job is marked failed;
+            retry_delay (float): Base delay (seconds) before a retry,
+                doubled after every failed attempt;
+            stale_after (float): Seconds after which a "running" job whose
+                worker vanished is picked up again.
+        """
+        self.app = app
+        self.client = client
+        self.data_manager = data_manager
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.stale_after = stale_after
+
+        self._executor = None
+        self._poller = None
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def ensure_started(self):
+        """
+        Start the thread pool and the poller on first use.
+
+        Called for the first request of a process too, so jobs left in
+        the table by a previous run (retries, deferred jobs) are picked
+        up without waiting for a new movie to be queued.
+        """
+        if self._executor is not None:
+            return
+        with self._start_lock:
+            if self._executor is not None:
+                return
+
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="enrichment",
+            )
+            self._poller = threading.Thread(
+                target=self._poll_loop,
+                name="enrichment-poller",
+                daemon=True,
+            )
+            self._poller.start()
+
+    def enqueue(self, movie, delay=0):
+        """
+        Queue enrichment for a freshly saved movie.
+
+        Args:
+            movie (Movie): A persisted movie with a title only;
+            delay (float): Seconds to wait before the job may run.
+
+        Returns:
+            EnrichmentJob: The queued job.
+        """
+        job = self.data_manager.create_enrichment_job(
+            movie, run_after=time.time() + delay
+        )
+        self.ensure_started()
+        if delay <= 0:
+            self._executor.submit(self._run_job, job.id)
+        return job
+
+    def enqueue_many(self, movies, delay=0):
+        """
+        Queue enrichment for many freshly saved movies in one transaction.
+
+        Args:
+            movies (list[Movie]): Persisted movies with a title only;
+            delay (float): Seconds to wait before the jobs may run.
+
+        Returns:
+            list[EnrichmentJob]: The queued jobs.
+        """
+        if not movies:
+            return []
+
+        jobs = self.data_manager.create_enrichment_jobs(
+            movies, run_after=time.time() + delay
+        )
+        self.ensure_started()
+        if delay <= 0:
+            for job in jobs:
+                self._executor.submit(self._run_job, job.id)
+        return jobs
+
+    def stop(self):
+        """Stop polling and wait for running jobs to finish."""
+        self._stop.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _poll_loop(self):
+        """Periodically submit due jobs (retries, deferred and orphaned ones)."""
+        # Scan at once: a fresh process may inherit due jobs
+        while not self._stop.is_set():
+            try:
+                with self.app.app_context():
+                    job_ids = self.data_manager.get_due_enrichment_job_ids(
+                        self.stale_after
+                    )
+                for job_id in job_ids:
+                    self._executor.submit(self._run_job, job_id)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Enrichment poller failed")
+            self._stop.wait(self.poll_interval)
+
+    def _run_job(self, job_id):
+        """Claim and run a single job inside an app context."""
+        with self.app.app_context():
+            try:
+                if not self.data_manager.claim_enrichment_job(job_id, self.stale_after):
+                    return  # someone else got it, or it is not due
+                self._enrich(self.data_manager.get_enrichment_job(job_id))
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Enrichment job %s crashed", job_id)
+
+    def _enrich(self, job):
+        """Look the job's title up in OMDb and update the movie."""
+        try:
+            data = self.client.lookup(job.title)
+        except OMDbUnavailableError as exc:
+            # OMDb is known to be down: wait for the breaker, keep the attempt
+            self.data_manager.finish_enrichment_job(
+                job.id,
+                EnrichmentJob.PENDING,
+                error=str(exc),
+                run_after=exc.retry_at,
+                count_attempt=False,
+            )
+            return
+        except (requests.exceptions.RequestException, ValueError) as exc:
+            self._retry_or_fail(job, str(exc) or exc.__class__.__name__)
+            return
+
+        if data.get("Response") == "False":
+            self.data_manager.finish_enrichment_job(
+                job.id, EnrichmentJob.FAILED, error=data.get("Error") or "Not found"
+            )
+            return
+
+        fields = movie_fields(data)
+        self.data_manager.update_movie(
+            job.user_id,
+            job.movie_id,
+            year=fields["year"],
+            director=fields["director"],
+            poster_url=fields["poster_url"],
+        )
+        self.data_manager.finish_enrichment_job(job.id, EnrichmentJob.DONE)
+
+    def _retry_or_fail(self, job, error):
+        """Reschedule a failed attempt with exponential backoff, or give up."""
+        if job.attempts >= self.max_attempts:
+            self.data_manager.finish_enrichment_job(
+                job.id, EnrichmentJob.FAILED, error=error
+            )
+            return
+
+        delay = self.retry_delay * 2 ** (job.attempts - 1)
+        self.data_manager.finish_enrichment_job(
+            job.id,
+            EnrichmentJob.PENDING,
+            error=error,
+            run_after=time.time() + delay,
+        )
@@ -0,0 +1,204 @@
+"""
+Group commit for database writes.
+
+With SQLite every commit is a synchronous write of the journal, and all
+writers queue for the same lock. GroupCommitWriter funnels write
+operations from many request threads into a single writer thread that
+applies them in one transaction and commits once per batch – after
+max_ops operations or max_delay seconds, whichever comes first.
+
+If an operation fails (e.g. a duplicate title), the batch is rolled
+back and re-run with one SAVEPOINT per operation, so only the failing
+operation is lost and its error is returned to its caller; the rest of
+the batch still commits. Operations must therefore be safe to re-run.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from models import db
+
+logger = logging.getLogger(__name__)
+
+
+class GroupCommitWriter:
+    """Single writer thread committing queued operations in batches."""
+
+    def __init__(self, app, max_ops=64, max_delay=0.002):
+        """
+        Args:
+            app (Flask): Application (operations run inside its app context);
+            max_ops (int): Max operations per transaction;
+            max_delay (float): Max seconds an operation waits for others
+                to join its batch.
+        """
+        self.app = app
+        self.max_ops = max_ops
+        self.max_delay = max_delay
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.operations = 0
+        self.failed_commits = 0
+
+    def ensure_started(self):
+        """Start the writer thread on first use."""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+
+            self._thread = threading.Thread(
+                target=self._run,
+                name="group-commit-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def submit(self, operation):
+        """
+        Queue a write operation.
+
+        The operation is called without arguments in the writer thread
+        and uses db.session as usual, but must not commit or roll back.
+        Returned ORM objects are detached from the writer's session with
+        their loaded attributes intact.
+
+        Args:
+            operation (callable): The write to perform.
+
+        Returns:
+            Future: Resolves to the operation's return value once the
+            batch is committed, or to the exception it (or the commit)
+            raised.
+        """
+        future = Future()
+        self.ensure_started()
+        self._queue.put((operation, future))
+        return future
+
+    def run(self, operation):
+        """Submit an operation and wait for its result (see submit)."""
+        return self.submit(operation).result()
+
+    def stop(self):
+        """Stop the writer thread after the queued operations are committed."""
+        self._stop.set()
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join()
+
+    def _next_batch(self):
+        """Block for one operation, then collect more until a limit is hit."""
+        item = self._queue.get()
+        if item is None:
+            return []
+
+        batch = [item]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_ops:
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout > 0:
+                    item = self._queue.get(timeout=timeout)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._stop.set()
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        """Writer loop: apply and commit batches until stopped."""
+        with self.app.app_context():
+            session = db.session()
+            # Results are handed to other threads: keep their attributes loaded
+            session.expire_on_commit = False
+
+            while True:
+                batch = self._next_batch()
+                if batch:
+                    self._apply(session, batch)
+                if self._stop.is_set() and self._queue.empty():
+                    break
+
+    def _apply(self, session, batch):
+        """Run one batch in a single transaction and resolve its futures."""
+        batch = [
+            (operation, future)
+            for operation, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+
+        try:
+            # Fast path: no savepoints while every operation succeeds
+            done = [(future, operation()) for operation, future in batch]
+            session.commit()
+        except Exception:  # pylint: disable=broad-exception-caught
+            session.rollback()
+            done = self._apply_isolated(session, batch)
+            if done is None:
+                return
+
+        with self._stats_lock:
+            self.batches += 1
+            self.operations += len(batch)
+
+        session.expunge_all()
+        for future, result in done:
+            future.set_result(result)
+
+    def _apply_isolated(self, session, batch):
+        """
+        Re-run a failed batch with one SAVEPOINT per operation.
+
+        Failing operations get their exception; the others are committed.
+
+        Returns:
+            list | None: (future, result) pairs, or None if the commit failed.
+        """
+        done = []
+        for operation, future in batch:
+            try:
+                with session.begin_nested():
+                    result = operation()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                future.set_exception(exc)
+            else:
+                done.append((future, result))
+
+        try:
+            session.commit()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            session.rollback()
+            session.expunge_all()
+            logger.exception("Group commit of %d operations failed", len(done))
+            with self._stats_lock:
+                self.failed_commits += 1
+            for future, _result in done:
+                future.set_exception(exc)
+            return None
+        return done
+
+    def stats(self):
+        """Return batch counters (average batch size shows the coalescing)."""
+        with self._stats_lock:
+            return {
+                "batches": self.batches,
+                "operations": self.operations,
+                "avg_batch_size": (
+                    round(self.operations / self.batches, 2) if self.batches else 0.0
+                ),
+                "failed_commits": self.failed_commits,
+                "queued": self._queue.qsize(),
+            }
@@ -0,0 +1,160 @@
+"""
+Response compression for dynamic text responses (HTML, JSON).
+
+init_compression registers an after_request hook that compresses
+responses with brotli (if the optional `brotli` package is installed)
+or gzip, depending on the client's Accept-Encoding:
+
+- responses smaller than min_size are sent as they are
+- static files are not compressed: Flask sends them with
+  direct_passthrough (a file wrapper, with its own ETag and 304
+  handling), so they are left to the web server in front of the app
+- streamed responses are compressed chunk by chunk, each chunk flushed
+  so the browser can start rendering before the body is complete
+- a strong ETag gets a "-gzip" / "-br" suffix, because each encoding is
+  a different representation (etag_variants lists what a client may send
+  back in If-None-Match)
+"""
+
+import gzip
+import zlib
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+# Types the app's views produce (static files are skipped, see above)
+COMPRESSIBLE_MIMETYPES = {
+    "text/html",
+    "text/plain",
+    "application/json",
+}
+
+ENCODING_SUFFIXES = {"gzip": "-gzip", "br": "-br"}
+
+
+def etag_variants(etag):
+    """Return the ETag of every representation of a resource (plain, gzip, br)."""
+    return [etag] + [etag + suffix for suffix in ENCODING_SUFFIXES.values()]
+
+
+def matched_variant(etag, encoding):
+    """
+    Return the variant of `etag` that the request's If-None-Match names.
+
+    The variant of the negotiated encoding wins if several match; with
+    no match the plain ETag is returned.
+    """
+    suffix = ENCODING_SUFFIXES.get(encoding, "")
+    candidates = [etag + suffix] + etag_variants(etag)
+    for tag in candidates:
+        if request.if_none_match.contains(tag):
+            return tag
+    return etag
+
+
+def choose_encoding(accept_encodings, brotli_quality):
+    """
+    Pick the content coding for a response.
+
+    Args:
+        accept_encodings: The request's parsed Accept-Encoding header;
+        brotli_quality (int | None): Brotli quality, or None to never use it.
+
+    Returns:
+        str | None: "br", "gzip" or None (send uncompressed).
+    """
+    gzip_q = accept_encodings["gzip"]
+    br_q = accept_encodings["br"] if brotli is not None and brotli_quality is not None else 0
+    if br_q and br_q >= gzip_q:
+        return "br"
+    if gzip_q:
+        return "gzip"
+    return None
+
+
+def _compress(data, encoding, gzip_level, brotli_quality):
+    """Compress a whole body."""
+    if encoding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+def _compress_stream(chunks, encoding, gzip_level, brotli_quality):
+    """Compress a streamed body, flushing after every chunk."""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=brotli_quality)
+        for chunk in chunks:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+        return
+
+    # wbits 31 = gzip container
+    compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _encode_chunks(iterable, charset="utf-8"):
+    """Yield a response iterable as bytes (templates stream str chunks)."""
+    for chunk in iterable:
+        yield chunk.encode(charset) if isinstance(chunk, str) else chunk
+
+
+def init_compression(app, min_size=500, gzip_level=6, brotli_quality=4):
+    """
+    Compress eligible responses of a Flask app.
+
+    Args:
+        app (Flask): The application;
+        min_size (int): Bodies smaller than this (bytes) are not compressed;
+        gzip_level (int): zlib level 1-9;
+        brotli_quality (int | None): Brotli quality 0-11 (None disables
+            brotli even when the package is installed).
+    """
+
+    @app.after_request
+    def compress_response(response):
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+            return response
+        response.vary.add("Accept-Encoding")
+
+        if "Content-Encoding" in response.headers or response.direct_passthrough:
+            return response
+
+        encoding = choose_encoding(request.accept_encodings, brotli_quality)
+        etag, weak = response.get_etag()
+        if response.status_code == 304:
+            # Validators must name the representation the client holds,
+            # which may be uncompressed (e.g. a body under min_size)
+            if etag and not weak:
+                response.set_etag(matched_variant(etag, encoding))
+            return response
+        if encoding is None:
+            return response
+        if response.status_code < 200 or response.status_code in (204, 206):
+            return response
+
+        if response.is_streamed:
+            response.response = _compress_stream(
+                _encode_chunks(response.response), encoding, gzip_level, brotli_quality
+            )
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < min_size:
+                return response
+            response.set_data(_compress(data, encoding, gzip_level, brotli_quality))
+
+        response.headers["Content-Encoding"] = encoding
+        if etag and not weak:
+            response.set_etag(etag + ENCODING_SUFFIXES[encoding])
+        return response
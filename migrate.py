@@ -0,0 +1,165 @@
+"""
+Schema upgrades for existing SQLite databases.
+
+db.create_all() creates missing tables but never touches existing ones,
+so indexes added to models later would be missing from old
+data/movies.db files. Run this once after updating the code:
+
+    python migrate.py
+
+The app also runs it on start-up (python app.py), except that it never
+deletes data there: if movies repeat a title, start-up stops and asks
+for `python migrate.py`. It is safe to run repeatedly.
+"""
+
+# pylint: disable=import-error
+
+from sqlalchemy import func
+from sqlalchemy.schema import CreateIndex
+
+from models import db, Movie, EnrichmentJob, create_movie_fts
+
+
+class DuplicateMoviesFound(RuntimeError):
+    """Raised when movies repeat a title and removing them was not allowed."""
+
+
+def find_duplicate_movie_ids():
+    """
+    Return the IDs of movies that repeat a title (case-insensitive) for the same user.
+
+    The oldest movie (lowest ID) of each group is not included.
+    """
+    keep_ids = (
+        db.select(func.min(Movie.id))
+        .group_by(Movie.user_id, func.lower(Movie.name))
+    )
+    return [
+        row.id
+        for row in db.session.query(Movie.id).filter(Movie.id.not_in(keep_ids)).all()
+    ]
+
+
+def remove_duplicate_movies():
+    """
+    Delete movies that repeat a title (case-insensitive) for the same user.
+
+    The oldest movie (lowest ID) of each group is kept. Needed before the
+    unique (user_id, lower(name)) index can be created.
+
+    Returns:
+        int: Number of deleted movies.
+    """
+    duplicate_ids = find_duplicate_movie_ids()
+    if not duplicate_ids:
+        return 0
+
+    EnrichmentJob.query.filter(EnrichmentJob.movie_id.in_(duplicate_ids)).delete(
+        synchronize_session=False
+    )
+    Movie.query.filter(Movie.id.in_(duplicate_ids)).delete(synchronize_session=False)
+    db.session.commit()
+    return len(duplicate_ids)
+
+
+def remove_orphan_enrichment_jobs():
+    """
+    Delete enrichment jobs whose movie no longer exists.
+
+    Older versions deleted movies without their jobs (foreign keys were
+    not enforced).
+
+    Returns:
+        int: Number of deleted jobs.
+    """
+    movie_ids = db.select(Movie.id)
+    removed = EnrichmentJob.query.filter(EnrichmentJob.movie_id.not_in(movie_ids)).delete(
+        synchronize_session=False
+    )
+    db.session.commit()
+    return removed
+
+
+def create_missing_indexes():
+    """Create every index declared on the models that the database lacks."""
+    # IF NOT EXISTS instead of checkfirst: SQLite reflection skips
+    # expression indexes such as lower(name)
+    with db.engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+
+
+def create_search_index():
+    """
+    Create the movie_fts full-text index if missing and fill it.
+
+    An index from before user_id was indexed (searches matched every
+    library) is dropped and rebuilt.
+
+    Returns:
+        bool: True if the index was created (and built from existing rows).
+    """
+    with db.engine.begin() as connection:
+        row = connection.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'movie_fts'"
+        ).first()
+        if row is not None and "user_id" in row.sql:
+            create_movie_fts(connection)
+            return False
+
+        if row is not None:
+            for trigger in ("movie_fts_ai", "movie_fts_ad", "movie_fts_au"):
+                connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+            connection.exec_driver_sql("DROP TABLE movie_fts")
+        create_movie_fts(connection)
+
+        # Index every movie that existed before the triggers
+        connection.exec_driver_sql("INSERT INTO movie_fts(movie_fts) VALUES ('rebuild')")
+        return True
+
+
+def upgrade_schema(remove_duplicates=False):
+    """
+    Bring the database up to date with the models.
+
+    Must be called inside an application context.
+
+    Args:
+        remove_duplicates (bool): Delete movies that repeat a title
+            (needed once for the unique title index); if False and there
+            are any, nothing is changed.
+
+    Returns:
+        dict: What was changed (for logging).
+
+    Raises:
+        DuplicateMoviesFound: If movies repeat a title and
+            remove_duplicates is False.
+    """
+    db.create_all()
+    if remove_duplicates:
+        removed = remove_duplicate_movies()
+    else:
+        removed = 0
+        duplicates = len(find_duplicate_movie_ids())
+        if duplicates:
+            raise DuplicateMoviesFound(
+                f"{duplicates} movies repeat a title of the same user. "
+                "Run `python migrate.py` to remove them (the oldest copy is kept)."
+            )
+    orphan_jobs = remove_orphan_enrichment_jobs()
+    create_missing_indexes()
+    search_index_built = create_search_index()
+    return {
+        "duplicate_movies_removed": removed,
+        "orphan_jobs_removed": orphan_jobs,
+        "search_index_built": search_index_built,
+    }
+
+
+if __name__ == "__main__":
+    from app import app
+
+    with app.app_context():
+        print(upgrade_schema(remove_duplicates=True))
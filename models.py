@@ -1,19 +1,45 @@
 """
 SQLAlchemy ORM models for the MoviWeb application.
 
-Contains two models:
+Contains the models:
 - User: represents an application user.
 - Movie: represents a movie saved by a user.
+  (mirrored into the movie_fts full-text index by triggers)
+- OMDbCacheEntry: a cached OMDb API response, shared by all workers.
+- OMDbMissEntry: a cached OMDb "not found" answer.
+- EnrichmentJob: a queued background OMDb lookup for a movie.
+- RateLimitBucket: token-bucket state shared by all worker processes.
+- CacheVersion: a counter bumped to invalidate in-process caches everywhere.
+- LibraryVersion: a per-user counter bumped by every change to a library.
 """
 
 # pylint: disable=import-error
 # pylint: disable=too-few-public-methods
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import column, event, table
 
 db = SQLAlchemy()
 
 
+def register_sqlite_pragmas(engine, pragmas):
+    """
+    Apply PRAGMA settings to every new SQLite connection of an engine.
+
+    Args:
+        engine: SQLAlchemy engine (must not have opened connections yet);
+        pragmas (dict): PRAGMA name → value; None or "" skips a pragma.
+    """
+    pragmas = {name: value for name, value in pragmas.items() if value not in (None, "")}
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        cursor.close()
+
+
 class User(db.Model):
     """Represents a registered user in the MoviWeb app."""
 
@@ -22,12 +48,18 @@ class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False, unique=True)
 
+    # Case-insensitive name lookups (lower(name) = lower(?)) seek this
+    # index; the plain unique index on name cannot serve them.
+    __table_args__ = (db.Index("ix_user_lower_name", db.func.lower(name)),)
+
     # Relationship: one user → many movies
-    # Cascade ensures movies are deleted when the user is deleted.
+    # The database deletes a user's movies (ON DELETE CASCADE on
+    # movie.user_id); passive_deletes stops the ORM from loading them first.
     movies = db.relationship(
         "Movie",
         back_populates="user",
         cascade="all, delete",
+        passive_deletes=True,
         lazy=True
     )
 
@@ -46,10 +78,184 @@ class Movie(db.Model):
     poster_url = db.Column(db.String(200))
 
     # Link Movie → User
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
 
     # Explicit relationship
     user = db.relationship("User", back_populates="movies")
 
+    # One title per user (case-insensitive), enforced by the database.
+    # (user_id, id) serves the keyset-paginated "movies of user X" list
+    # without sorting.
+    __table_args__ = (
+        db.Index(
+            "uq_movie_user_lower_name",
+            user_id,
+            db.func.lower(name),
+            unique=True,
+        ),
+        db.Index("ix_movie_user_id_id", user_id, id),
+    )
+
+    def __repr__(self):
+        return f"<Movie id={self.id} name={self.name!r} user_id={self.user_id}>"
+
+
+# SQLite FTS5 index over movie titles and directors. It is an
+# "external content" table: it stores only the index and reads the text
+# from `movie`; the triggers keep it in sync on every insert/update/delete.
+# The owner's ID is indexed too, so a search is narrowed to one user's
+# movies inside FTS (user_id : "42" AND ...) instead of matching every
+# library first. Prefix indexes make short prefixes ("th"*) cheap.
+MOVIE_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS movie_fts USING fts5(
+        name, director, user_id,
+        content='movie', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS movie_fts_ai AFTER INSERT ON movie BEGIN
+        INSERT INTO movie_fts(rowid, name, director, user_id)
+        VALUES (new.id, new.name, new.director, new.user_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS movie_fts_ad AFTER DELETE ON movie BEGIN
+        INSERT INTO movie_fts(movie_fts, rowid, name, director, user_id)
+        VALUES ('delete', old.id, old.name, old.director, old.user_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS movie_fts_au
+    AFTER UPDATE OF name, director, user_id ON movie BEGIN
+        INSERT INTO movie_fts(movie_fts, rowid, name, director, user_id)
+        VALUES ('delete', old.id, old.name, old.director, old.user_id);
+        INSERT INTO movie_fts(rowid, name, director, user_id)
+        VALUES (new.id, new.name, new.director, new.user_id);
+    END
+    """,
+)
+
+# Lightweight handle for queries (not part of the metadata, so
+# create_all() never tries to create it as a regular table)
+movie_fts = table(
+    "movie_fts", column("rowid"), column("name"), column("director"), column("user_id")
+)
+
+
+def create_movie_fts(connection):
+    """Create the movie_fts index and its sync triggers if missing."""
+    for statement in MOVIE_FTS_DDL:
+        connection.exec_driver_sql(statement)
+
+
+@event.listens_for(Movie.__table__, "after_create")
+def _create_movie_fts(_target, connection, **_kwargs):
+    """Set up full-text search whenever the movie table is created."""
+    if connection.dialect.name == "sqlite":
+        create_movie_fts(connection)
+
+
+class CachedResponseMixin:
+    """Columns shared by the OMDb response cache tables."""
+
+    title_key = db.Column(db.String(200), primary_key=True)
+    payload = db.Column(db.Text, nullable=False)  # raw OMDb JSON
+
+    # Unix timestamps (seconds)
+    fetched_at = db.Column(db.Float, nullable=False)
+    last_access = db.Column(db.Float, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} title_key={self.title_key!r}>"
+
+
+class OMDbCacheEntry(CachedResponseMixin, db.Model):
+    """Represents a cached OMDb response, keyed by normalized movie title."""
+    __tablename__ = "omdb_cache"
+
+
+class OMDbMissEntry(CachedResponseMixin, db.Model):
+    """Represents a cached OMDb "Movie not found!" answer."""
+    __tablename__ = "omdb_miss_cache"
+
+
+class EnrichmentJob(db.Model):
+    """Represents a background job filling a movie's details from OMDb."""
+    __tablename__ = "enrichment_job"
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    id = db.Column(db.Integer, primary_key=True)
+    movie_id = db.Column(
+        db.Integer,
+        db.ForeignKey("movie.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    user_id = db.Column(db.Integer, nullable=False)
+    title = db.Column(db.String(100), nullable=False)
+
+    status = db.Column(db.String(20), nullable=False, default=PENDING)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.String(200))
+
+    # Unix timestamps (seconds); the job is not picked up before run_after
+    run_after = db.Column(db.Float, nullable=False)
+    created_at = db.Column(db.Float, nullable=False)
+    updated_at = db.Column(db.Float, nullable=False)
+
+    __table_args__ = (db.Index("ix_enrichment_job_status_run_after", "status", "run_after"),)
+
+    def __repr__(self):
+        return f"<EnrichmentJob id={self.id} movie_id={self.movie_id} status={self.status}>"
+
+
+class RateLimitBucket(db.Model):
+    """Represents the state of a token bucket (e.g. for the OMDb API key)."""
+    __tablename__ = "rate_limit_bucket"
+
+    name = db.Column(db.String(50), primary_key=True)
+    tokens = db.Column(db.Float, nullable=False)
+    updated_at = db.Column(db.Float, nullable=False)  # Unix timestamp
+
+    # Calls made on `day` (UTC date, YYYY-MM-DD), for the daily budget
+    day = db.Column(db.String(10), nullable=False)
+    day_count = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<RateLimitBucket name={self.name!r} tokens={self.tokens:.2f}>"
+
+
+class CacheVersion(db.Model):
+    """Represents the version of a cached data set (bumped on every write)."""
+    __tablename__ = "cache_version"
+
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.Float, nullable=False)  # Unix timestamp
+
+    def __repr__(self):
+        return f"<CacheVersion name={self.name!r} version={self.version}>"
+
+
+class LibraryVersion(db.Model):
+    """Represents the version of a user's library (movies and their jobs)."""
+    __tablename__ = "library_version"
+
+    # No foreign key on purpose: the row outlives a deleted user, so a new
+    # user who gets the same ID (SQLite reuses IDs) continues the numbering
+    # and never matches an ETag issued for the old library.
+    user_id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.Float, nullable=False)  # Unix timestamp
+
     def __repr__(self):
-        return f"<Movie id={self.id} name={self.name!r} user_id={self.user_id}>"
\ No newline at end of file
+        return f"<LibraryVersion user_id={self.user_id} version={self.version}>"
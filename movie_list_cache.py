@@ -0,0 +1,180 @@
+"""
+Cache of rendered-ready movie list pages.
+
+A user's library changes rarely compared with how often it is viewed,
+so each page (user, search term, cursor, page size) is stored as JSON
+and served without touching the movie table.
+
+Invalidation is version-based: every page key contains the user's
+library version (the LibraryVersion row, bumped in the same transaction
+as every write to the library). The caller reads it with one
+primary-key lookup, so a write made by any process is seen by the next
+request. Pages of older versions are never read again and age out of
+the backend (TTL / LRU).
+
+Backends:
+- MemoryBackend: in-process LRU (TTLCache); each worker process has its
+  own pages.
+- RedisBackend: any Redis-compatible server shared by all workers
+  (needs the optional `redis` package).
+"""
+
+import json
+import logging
+import threading
+
+from ttl_cache import TTLCache
+
+try:
+    import redis
+except ImportError:  # optional dependency
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryBackend:
+    """In-process backend: pages in a TTLCache."""
+
+    def __init__(self, max_size=1000, ttl=60):
+        """
+        Args:
+            max_size (int): Max pages kept in memory;
+            ttl (float): Default seconds a page stays cached.
+        """
+        self.pages = TTLCache(max_size=max_size, ttl=ttl)
+
+    def get(self, key):
+        """Return the stored value for `key`, or None."""
+        return self.pages.get(key)
+
+    def set(self, key, value, ttl):
+        """Store `value` under `key` for `ttl` seconds."""
+        self.pages.set(key, value, ttl=ttl)
+
+
+class RedisBackend:
+    """Shared backend on a Redis-compatible server."""
+
+    def __init__(self, url=None, client=None):
+        """
+        Args:
+            url (str | None): Server URL, e.g. redis://localhost:6379/0;
+            client: Ready-made client (instead of `url`).
+
+        Raises:
+            RuntimeError: If no client is given and `redis` is not installed.
+        """
+        if client is None:
+            if redis is None:
+                raise RuntimeError(
+                    "The redis package is required for the redis movie list cache."
+                )
+            client = redis.Redis.from_url(url)
+        self.client = client
+
+    def get(self, key):
+        """Return the stored value for `key`, or None."""
+        value = self.client.get(key)
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def set(self, key, value, ttl):
+        """Store `value` under `key` for `ttl` seconds."""
+        self.client.set(key, value, ex=max(1, int(ttl)))
+
+
+def create_backend(name, url=None, max_size=1000, ttl=60):
+    """
+    Build a backend from configuration.
+
+    Args:
+        name (str): "memory" or "redis";
+        url (str | None): Server URL for the redis backend;
+        max_size (int): Max pages for the memory backend;
+        ttl (float): Default page TTL for the memory backend.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if name == "memory":
+        return MemoryBackend(max_size=max_size, ttl=ttl)
+    if name == "redis":
+        return RedisBackend(url=url)
+    raise ValueError(f"Unknown movie list cache backend: {name!r}")
+
+
+class MovieListCache:
+    """Per-user cache of movie list pages keyed by library version."""
+
+    def __init__(self, backend, ttl=60, prefix="movies"):
+        """
+        Args:
+            backend (MemoryBackend | RedisBackend): Where pages are stored;
+            ttl (float): Seconds a page stays cached;
+            prefix (str): Prefix of every key (to share a Redis database).
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = prefix
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def get_or_load(self, user_id, version, page_key, loader):
+        """
+        Return a cached page, or build it with `loader` and cache it.
+
+        The version must be read before the loader runs, so a page built
+        from data that a concurrent write has since changed is stored
+        under the old version and never served.
+
+        Args:
+            user_id (int): Owner of the library;
+            version (int): The library's current version;
+            page_key (tuple): What identifies the page within the library
+                (page size, cursors, search term);
+            loader (callable): Builds the page as JSON-serializable data.
+
+        Returns:
+            The page data (as returned by `loader`, after a JSON round-trip
+            on a hit).
+        """
+        key = f"{self.prefix}:{user_id}:{version}:{json.dumps(page_key)}"
+        try:
+            cached = self.backend.get(key)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning("Movie list cache unavailable", exc_info=True)
+            self._count("errors")
+            return loader()
+
+        if cached is not None:
+            self._count("hits")
+            return json.loads(cached)
+
+        self._count("misses")
+        data = loader()
+        try:
+            self.backend.set(key, json.dumps(data), self.ttl)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning("Could not store a movie list page", exc_info=True)
+            self._count("errors")
+        return data
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self):
+        """Return hit/miss counters and the hit ratio."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": type(self.backend).__name__,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "errors": self.errors,
+                "ttl": self.ttl,
+            }
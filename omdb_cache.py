@@ -0,0 +1,158 @@
+"""
+Two-level cache for OMDb API responses.
+
+Lookups go through:
+- an in-process LRU (TTLCache) – no I/O at all
+- a persistent SQLite table (OMDbCacheEntry) – shared by every worker
+  and kept across restarts
+
+Entries are keyed by the normalized title, expire after a configurable
+TTL and both layers are size-capped with least-recently-used eviction.
+The same class backs the negative cache of "not found" answers, which
+uses its own table (OMDbMissEntry) and a shorter TTL.
+"""
+
+import json
+import time
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from models import db, OMDbCacheEntry
+from ttl_cache import TTLCache
+
+
+def normalize_title(title):
+    """
+    Return the cache key for a movie title.
+
+    Collapses inner whitespace, strips and lowercases the title so that
+    "Inception", " inception " and "INCEPTION" share one entry.
+    """
+    return " ".join((title or "").split()).lower()
+
+
+class OMDbCache:
+    """In-process LRU in front of a persistent, size-capped SQLite table."""
+
+    def __init__(self, ttl=86400, memory_size=1024, max_entries=50000,
+                 model=OMDbCacheEntry):
+        """
+        Args:
+            ttl (float): Seconds a cached response stays valid;
+            memory_size (int): Max entries in the in-process LRU;
+            max_entries (int): Max rows kept in the persistent table;
+            model: ORM model backing the persistent layer.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.model = model
+        self.memory = TTLCache(max_size=memory_size, ttl=ttl)
+
+        self.db_hits = 0
+        self.db_misses = 0
+        self.db_evictions = 0
+        self.db_errors = 0
+
+    def get(self, title):
+        """
+        Return the cached OMDb response for `title`, or None on a miss.
+
+        A hit in the persistent table is promoted into the in-process LRU.
+        """
+        key = normalize_title(title)
+        if not key:
+            return None
+
+        data = self.memory.get(key)
+        if data is not None:
+            return data
+
+        try:
+            entry = db.session.get(self.model, key)
+            now = time.time()
+
+            if entry is None:
+                self.db_misses += 1
+                return None
+
+            if entry.fetched_at + self.ttl <= now:
+                # Expired → drop it and treat as a miss
+                db.session.delete(entry)
+                db.session.commit()
+                self.db_misses += 1
+                return None
+
+            entry.last_access = now
+            data = json.loads(entry.payload)
+            db.session.commit()
+        except (SQLAlchemyError, ValueError):
+            # The cache must never break the add-movie flow
+            db.session.rollback()
+            self.db_errors += 1
+            return None
+
+        self.db_hits += 1
+        self.memory.set(key, data, ttl=max(entry.fetched_at + self.ttl - now, 0))
+        return data
+
+    def set(self, title, data):
+        """Store an OMDb response for `title` in both cache layers."""
+        key = normalize_title(title)
+        if not key:
+            return
+
+        self.memory.set(key, data)
+
+        now = time.time()
+        try:
+            db.session.merge(
+                self.model(
+                    title_key=key,
+                    payload=json.dumps(data),
+                    fetched_at=now,
+                    last_access=now,
+                )
+            )
+            db.session.commit()
+            self._evict_overflow()
+        except SQLAlchemyError:
+            db.session.rollback()
+            self.db_errors += 1
+
+    def _evict_overflow(self):
+        """Delete least recently used rows beyond `max_entries`."""
+        overflow = self.model.query.count() - self.max_entries
+        if overflow <= 0:
+            return
+
+        stale_keys = (
+            db.session.query(self.model.title_key)
+            .order_by(self.model.last_access)
+            .limit(overflow)
+            .subquery()
+        )
+        deleted = self.model.query.filter(
+            self.model.title_key.in_(db.select(stale_keys.c.title_key))
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        self.db_evictions += deleted
+
+    @property
+    def hits(self):
+        """Total lookups answered by either layer."""
+        return self.memory.hits + self.db_hits
+
+    def stats(self):
+        """Return hit/miss/eviction counters for both layers."""
+        return {
+            "hits": self.hits,
+            "memory": self.memory.stats(),
+            "persistent": {
+                "ttl": self.ttl,
+                "max_entries": self.max_entries,
+                "hits": self.db_hits,
+                "misses": self.db_misses,
+                "evictions": self.db_evictions,
+                "errors": self.db_errors,
+            },
+        }
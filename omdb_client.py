@@ -0,0 +1,238 @@
+"""
+HTTP client for the OMDb API.
+
+Owns a single keep-alive `requests.Session` whose connection pool is
+shared by every request in the process, with bounded retries and
+separate connect/read timeouts. Responses go through an OMDbCache so
+repeat lookups never touch the network, and concurrent lookups of the
+same title are coalesced into a single upstream call. An optional
+circuit breaker makes lookups fail fast while OMDb is unhealthy, and
+an optional token bucket keeps calls within the API key's quota.
+"""
+
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from omdb_cache import normalize_title
+from singleflight import SingleFlight
+
+OMDB_URL = "http://www.omdbapi.com/"
+
+# OMDb "Response": "False" errors that mean the title does not exist
+# (as opposed to quota or API key problems, which must not be cached)
+NOT_FOUND_ERRORS = frozenset({"Movie not found!"})
+
+
+class OMDbUnavailableError(requests.exceptions.RequestException):
+    """Raised without calling OMDb because it must not be called right now."""
+
+    def __init__(self, message, retry_at):
+        super().__init__(message)
+        self.retry_at = retry_at
+
+
+class OMDbRateLimitedError(OMDbUnavailableError):
+    """Raised without calling OMDb because the API key's rate limit is used up."""
+
+
+def parse_year(year_str):
+    """
+    Convert a raw year string to an integer, if possible.
+
+    Returns:
+        int | None: Parsed year, or None if the input is empty/invalid.
+    """
+    if not year_str:
+        return None
+
+    year_str = str(year_str).strip()
+    if not year_str:
+        return None
+
+    try:
+        return int(year_str)
+    except ValueError:
+        return None
+
+
+def movie_fields(data, fallback_title=None):
+    """
+    Extract Movie column values from an OMDb response.
+
+    "N/A" values are treated as missing.
+
+    Args:
+        data (dict): Parsed JSON response from the OMDb API;
+        fallback_title (str | None): Title to use if OMDb does not provide one.
+
+    Returns:
+        dict: name, director, year and poster_url (values may be None).
+    """
+    director = data.get("Director")
+    if director in (None, "N/A"):
+        director = None
+
+    poster = data.get("Poster")
+    if poster in (None, "N/A"):
+        poster = None
+
+    return {
+        "name": data.get("Title") or fallback_title,
+        "director": director,
+        "year": parse_year(data.get("Year")),
+        "poster_url": poster,
+    }
+
+
+class OMDbClient:
+    """Pooled, retrying OMDb client with a response cache in front."""
+
+    def __init__(self, api_key, cache=None, negative_cache=None,
+                 base_url=OMDB_URL, pool_size=10, max_retries=2,
+                 backoff_factor=0.3, connect_timeout=2.0, read_timeout=4.0,
+                 lock_dir=None, breaker=None, rate_limiter=None):
+        """
+        Args:
+            api_key (str): OMDb API key;
+            cache (OMDbCache | None): Optional response cache;
+            negative_cache (OMDbCache | None): Optional cache of
+                "not found" answers;
+            base_url (str): OMDb endpoint;
+            pool_size (int): Max keep-alive connections (≈ worker threads);
+            max_retries (int): Retries for connection errors and 5xx answers
+                (read timeouts are not retried);
+            backoff_factor (float): Exponential backoff between retries;
+            connect_timeout (float): Seconds to establish a connection;
+            read_timeout (float): Seconds to wait for the response;
+            lock_dir (str | Path | None): Directory for the cross-process
+                single-flight locks (None = coalesce within this process only);
+            breaker (CircuitBreaker | None): Optional breaker guarding OMDb calls;
+            rate_limiter (TokenBucket | None): Optional limiter for the API key.
+        """
+        self.api_key = api_key
+        self.cache = cache
+        self.negative_cache = negative_cache
+        self.breaker = breaker
+        self.rate_limiter = rate_limiter
+        self.flight = SingleFlight(lock_dir=lock_dir)
+        self.base_url = base_url
+        self.timeout = (connect_timeout, read_timeout)
+
+        # Retry only failed connects and 5xx answers: a read timeout means
+        # OMDb is slow, and waiting read_timeout again only adds latency
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            other=0,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+        )
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def lookup(self, title):
+        """
+        Return the OMDb response for a title, using the cache when possible.
+
+        Found movies go to the response cache and "Movie not found!" answers
+        to the negative cache; network and JSON errors propagate to the
+        caller so it can fall back to a basic movie. Concurrent lookups of
+        the same title share one upstream request.
+
+        Args:
+            title (str): Movie title as typed by the user.
+
+        Returns:
+            dict: Parsed JSON response from the OMDb API.
+
+        Raises:
+            OMDbUnavailableError: If the circuit breaker is open or the
+                rate limit is used up (OMDbRateLimitedError).
+            requests.exceptions.RequestException: On network errors.
+            ValueError: If the response is not valid JSON.
+        """
+        data = self._cached(title)
+        if data is not None:
+            return data
+
+        return self.flight.do(normalize_title(title), lambda: self._lookup_uncached(title))
+
+    def _cached(self, title):
+        """Return the cached (positive or negative) response for a title, or None."""
+        for cache in (self.cache, self.negative_cache):
+            if cache is not None:
+                data = cache.get(title)
+                if data is not None:
+                    return data
+        return None
+
+    def _lookup_uncached(self, title):
+        """Fetch a title from OMDb and cache the answer (single-flight leader)."""
+        # Another process may have filled the cache while we waited for the lock
+        data = self._cached(title)
+        if data is not None:
+            return data
+
+        data = self._fetch(title)
+
+        if data.get("Response") != "False":
+            if self.cache is not None:
+                self.cache.set(title, data)
+        elif data.get("Error") in NOT_FOUND_ERRORS and self.negative_cache is not None:
+            self.negative_cache.set(title, data)
+        return data
+
+    def _fetch(self, title):
+        """Call the OMDb API over the pooled session, guarded by breaker and limiter."""
+        # Breaker first: a call it rejects must not spend a token or daily budget
+        if self.breaker is not None and not self.breaker.allow_request():
+            raise OMDbUnavailableError(
+                "OMDb circuit breaker is open", retry_at=self.breaker.retry_at
+            )
+
+        if self.rate_limiter is not None and not self.rate_limiter.try_acquire():
+            if self.breaker is not None:
+                self.breaker.release()
+            raise OMDbRateLimitedError(
+                "OMDb rate limit reached", retry_at=self.rate_limiter.retry_at()
+            )
+
+        if self.breaker is None:
+            return self._get(title)
+
+        started = time.monotonic()
+        try:
+            data = self._get(title)
+        except Exception:
+            self.breaker.record_failure()
+            raise
+
+        self.breaker.record_success(time.monotonic() - started)
+        return data
+
+    def _get(self, title):
+        """Send the HTTP request and decode the JSON answer."""
+        response = self.session.get(
+            self.base_url,
+            params={"t": title, "apikey": self.api_key},
+            timeout=self.timeout,
+        )
+        return response.json()
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
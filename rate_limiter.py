@@ -0,0 +1,168 @@
+"""
+Token-bucket rate limiter shared by all worker processes.
+
+The bucket lives in a SQLite row (RateLimitBucket). Taking a token is a
+single conditional UPDATE that refills the bucket from the elapsed time,
+checks the daily budget and decrements in one statement, so concurrent
+threads and processes can never overspend.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import case, func, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from models import db, RateLimitBucket
+
+
+def _utc_day(now):
+    """Return the UTC date of a Unix timestamp as YYYY-MM-DD."""
+    return datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _next_utc_midnight(now):
+    """Return the Unix timestamp of the next UTC midnight."""
+    today = datetime.fromtimestamp(now, tz=timezone.utc).date()
+    midnight = datetime.combine(today + timedelta(days=1), datetime.min.time(), timezone.utc)
+    return midnight.timestamp()
+
+
+class TokenBucket:
+    """SQLite-backed token bucket with an optional daily budget."""
+
+    def __init__(self, name, rate=5.0, capacity=10, daily_budget=None):
+        """
+        Args:
+            name (str): Bucket name (one row per name);
+            rate (float): Tokens added per second;
+            capacity (int): Maximum burst size;
+            daily_budget (int | None): Max tokens per UTC day (None = no limit).
+        """
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.daily_budget = daily_budget
+
+        self.granted = 0
+        self.denied = 0
+        self.errors = 0
+        self._row_ready = False
+
+    def try_acquire(self):
+        """
+        Take one token if available, without blocking.
+
+        If the bucket table cannot be used, the call is allowed
+        (the limiter must never break the add-movie flow).
+
+        Returns:
+            bool: True if the caller may proceed.
+        """
+        now = time.time()
+        today = _utc_day(now)
+        bucket = RateLimitBucket
+        # Two-argument min() is a scalar SQL function (pylint cannot infer func.*)
+        refilled = func.min(  # pylint: disable=assignment-from-no-return
+            self.capacity,
+            bucket.tokens + (now - bucket.updated_at) * self.rate,
+        )
+
+        conditions = [bucket.name == self.name, refilled >= 1]
+        if self.daily_budget is not None:
+            conditions.append((bucket.day != today) | (bucket.day_count < self.daily_budget))
+
+        try:
+            self._ensure_row(now, today)
+            result = db.session.execute(
+                update(bucket)
+                .where(*conditions)
+                .values(
+                    tokens=refilled - 1,
+                    updated_at=now,
+                    day=today,
+                    day_count=case(
+                        (bucket.day == today, bucket.day_count + 1),
+                        else_=1,
+                    ),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+            # Only now is the row known to exist: a rollback undoes the insert
+            self._row_ready = True
+        except SQLAlchemyError:
+            db.session.rollback()
+            self.errors += 1
+            return True
+
+        if result.rowcount == 1:
+            self.granted += 1
+            return True
+
+        self.denied += 1
+        return False
+
+    def retry_at(self):
+        """Return the Unix time at which a token should be available again."""
+        state = self.remaining()
+        now = time.time()
+        if state["daily_remaining"] == 0:
+            return _next_utc_midnight(now)
+        missing = max(1 - state["tokens"], 0)
+        return now + missing / self.rate
+
+    def remaining(self):
+        """
+        Return the current tokens and what is left of the daily budget.
+
+        Returns:
+            dict: tokens (float) and daily_remaining (int | None).
+        """
+        now = time.time()
+        try:
+            row = db.session.get(RateLimitBucket, self.name)
+        except SQLAlchemyError:
+            db.session.rollback()
+            row = None
+
+        if row is None:
+            return {"tokens": float(self.capacity), "daily_remaining": self.daily_budget}
+
+        tokens = min(self.capacity, row.tokens + (now - row.updated_at) * self.rate)
+        daily_remaining = None
+        if self.daily_budget is not None:
+            used = row.day_count if row.day == _utc_day(now) else 0
+            daily_remaining = max(self.daily_budget - used, 0)
+
+        return {"tokens": round(tokens, 2), "daily_remaining": daily_remaining}
+
+    def _ensure_row(self, now, today):
+        """Create the bucket row (full) if it does not exist yet."""
+        if self._row_ready:
+            return
+        db.session.execute(
+            insert(RateLimitBucket)
+            .values(
+                name=self.name,
+                tokens=self.capacity,
+                updated_at=now,
+                day=today,
+                day_count=0,
+            )
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+
+    def stats(self):
+        """Return configuration, remaining budget and counters."""
+        return {
+            "name": self.name,
+            "rate_per_second": self.rate,
+            "capacity": self.capacity,
+            "daily_budget": self.daily_budget,
+            **self.remaining(),
+            "granted": self.granted,
+            "denied": self.denied,
+            "errors": self.errors,
+        }
@@ -0,0 +1,111 @@
+"""
+Request coalescing ("single-flight") for expensive lookups.
+
+Concurrent calls for the same key share one execution:
+- within a process, the first thread runs the call and the others
+  wait for its result;
+- across worker processes, the running thread also holds an exclusive
+  file lock for the key, so another process's leader waits and can then
+  pick the result up from a shared cache instead of calling again.
+
+File locks need `fcntl` (POSIX). Where it is missing (Windows) only
+in-process coalescing is done.
+"""
+
+import hashlib
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key."""
+
+    def __init__(self, lock_dir=None, lock_stripes=64):
+        """
+        Args:
+            lock_dir (str | Path | None): Directory for cross-process lock
+                files (None = in-process coalescing only);
+            lock_stripes (int): Number of lock files keys are hashed onto.
+        """
+        self.lock_dir = Path(lock_dir) if lock_dir and fcntl else None
+        self.lock_stripes = lock_stripes
+        if self.lock_dir is not None:
+            self.lock_dir.mkdir(parents=True, exist_ok=True)
+
+        self._calls = {}
+        self._lock = threading.Lock()
+
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        """
+        Run `fn()` once for all concurrent callers with the same key.
+
+        Args:
+            key (str): Coalescing key (e.g. a normalized title);
+            fn (callable): Zero-argument function doing the real work.
+
+        Returns:
+            The result of `fn()`; exceptions are re-raised to every caller.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                future = Future()
+                self._calls[key] = future
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            with self._process_lock(key):
+                result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    @contextmanager
+    def _process_lock(self, key):
+        """Hold an exclusive file lock for `key` (no-op without lock_dir)."""
+        if self.lock_dir is None:
+            yield
+            return
+
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        stripe = int(digest, 16) % self.lock_stripes
+        path = self.lock_dir / f"flight-{stripe}.lock"
+
+        with open(path, "a+b") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def stats(self):
+        """Return leader/coalesced call counters."""
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+            "cross_process": self.lock_dir is not None,
+        }
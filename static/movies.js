@@ -0,0 +1,50 @@
+/*
+ * Movie list (movies.html): one shared inline editor and one shared
+ * delete modal for all movies. Each card only carries its movie's id,
+ * title and year as data attributes; the editor and the modal are
+ * pointed at a movie when its Update / Delete button is clicked.
+ */
+(function () {
+    "use strict";
+
+    const list = document.getElementById("movie-list");
+    const editor = document.getElementById("movie-editor");
+    const modal = document.getElementById("confirmDelete");
+    if (!list || !editor || !modal) {
+        return;
+    }
+
+    // The list holds URLs built for movie ID 0; swap in the real ID
+    function movieUrl(template, movieId) {
+        return template.replace("/movies/0/", "/movies/" + movieId + "/");
+    }
+
+    // Update: move the editor into the card and aim it at that movie
+    list.addEventListener("click", function (event) {
+        const button = event.target.closest("[data-action='edit']");
+        if (!button) {
+            return;
+        }
+        const card = button.closest("[data-movie-id]");
+
+        editor.reset();
+        editor.action = movieUrl(list.dataset.updateUrl, card.dataset.movieId);
+        card.querySelector(".movie-editor-slot").appendChild(editor);
+        editor.hidden = false;
+        editor.querySelector("input").focus();
+    });
+
+    editor.querySelector("[data-action='cancel']").addEventListener("click", function () {
+        editor.hidden = true;
+    });
+
+    // Delete: fill the modal from the card whose button opened it
+    modal.addEventListener("show.bs.modal", function (event) {
+        const card = event.relatedTarget.closest("[data-movie-id]");
+        const year = card.dataset.movieYear;
+
+        modal.querySelector("form").action = movieUrl(list.dataset.deleteUrl, card.dataset.movieId);
+        modal.querySelector(".movie-name").textContent = card.dataset.movieName;
+        modal.querySelector(".movie-year").textContent = year ? " (" + year + ")" : "";
+    });
+})();
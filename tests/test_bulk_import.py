@@ -0,0 +1,37 @@
+"""Tests for parsing bulk import titles."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bulk_import import dedupe_titles, parse_titles  # noqa: E402  pylint: disable=wrong-import-position
+
+TITLES = [
+    "Lock, Stock and Two Smoking Barrels",
+    "Crouching Tiger, Hidden Dragon",
+    "The Good, the Bad and the Ugly",
+    '"Heat" (1995)',
+]
+
+
+def test_plain_lines_keep_commas_and_quotes():
+    """Each line of a pasted list or .txt upload is one whole title."""
+    assert parse_titles(text="\n".join(TITLES) + "\n") == TITLES
+
+
+def test_plain_lines_keep_a_title_called_title():
+    """Only CSV input has a header row."""
+    assert dedupe_titles(parse_titles(text="Title\r\n\r\nHeat\r\n")) == ["Title", "Heat"]
+
+
+def test_csv_uses_first_column_and_skips_header():
+    """CSV uploads keep quoted commas and drop the other columns."""
+    text = 'title,year\n"Crouching Tiger, Hidden Dragon",2000\nHeat,1995\n'
+    assert parse_titles(text=text, is_csv=True) == ["Crouching Tiger, Hidden Dragon", "Heat"]
+
+
+def test_json_array_of_strings_and_objects():
+    """JSON items may be strings or objects with a "title"."""
+    data = ["Heat", {"title": "Lock, Stock and Two Smoking Barrels"}, {"year": 1999}, 7]
+    assert parse_titles(json_data=data) == ["Heat", "Lock, Stock and Two Smoking Barrels"]
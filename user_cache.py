@@ -0,0 +1,131 @@
+"""
+Read-through cache of users for the movie routes.
+
+Every page of a user's library starts with "does this user exist and
+what is their name". UserCache keeps id → UserRecord(id, name) in an
+in-process LRU (TTLCache), so hot users cost no query at all.
+
+Other worker processes learn about deletions through a version counter
+row (CacheVersion): every user write bumps it in the same transaction,
+and each process compares it with the version it last saw at most once
+per check_interval, dropping its whole cache when it changed.
+"""
+
+import threading
+import time
+from collections import namedtuple
+
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from models import db, CacheVersion
+from ttl_cache import TTLCache
+
+# The columns of a user the routes need
+UserRecord = namedtuple("UserRecord", ["id", "name"])
+
+
+class UserCache:
+    """In-process LRU of users, invalidated across processes by a version row."""
+
+    def __init__(self, ttl=300, max_size=10000, check_interval=1.0, name="users"):
+        """
+        Args:
+            ttl (float): Seconds a user stays cached;
+            max_size (int): Max users kept in memory;
+            check_interval (float): Max seconds between reads of the
+                version row (the staleness bound for other processes'
+                writes);
+            name (str): Name of the version row.
+        """
+        self.name = name
+        self.check_interval = check_interval
+        self.memory = TTLCache(max_size=max_size, ttl=ttl)
+
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = None
+
+        self.version_checks = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    def get(self, user_id):
+        """
+        Return the cached UserRecord for `user_id`, or None on a miss.
+
+        Must be called inside an application context (the version row
+        may be read).
+        """
+        if not self._in_sync():
+            return None
+        return self.memory.get(user_id)
+
+    def set(self, record):
+        """Cache a UserRecord loaded from the database."""
+        if self._version is not None:
+            self.memory.set(record.id, record)
+
+    def invalidate(self, user_id):
+        """Drop one user from this process' cache."""
+        self.memory.delete(user_id)
+
+    def bump_version(self):
+        """
+        Tell every process its cached users may be stale.
+
+        Executes an upsert in the current transaction, so the bump is
+        committed (or rolled back) together with the write that caused it.
+        """
+        now = time.time()
+        db.session.execute(
+            insert(CacheVersion)
+            .values(name=self.name, version=1, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=[CacheVersion.name],
+                set_={"version": CacheVersion.version + 1, "updated_at": now},
+            )
+        )
+
+    def _in_sync(self):
+        """
+        Re-read the version row if check_interval has passed.
+
+        Returns:
+            bool: False if the version cannot be read (cache bypassed).
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.check_interval:
+                return self._version is not None
+            self._checked_at = now
+
+        try:
+            version = db.session.execute(
+                db.select(CacheVersion.version).where(CacheVersion.name == self.name)
+            ).scalar()
+        except SQLAlchemyError:
+            db.session.rollback()
+            self.errors += 1
+            self.memory.clear()
+            self._version = None
+            return False
+
+        version = version or 0
+        self.version_checks += 1
+        if version != self._version:
+            if self._version is not None:
+                self.invalidations += 1
+            self.memory.clear()
+            self._version = version
+        return True
+
+    def stats(self):
+        """Return hit/miss counters plus version checks and invalidations."""
+        return {
+            **self.memory.stats(),
+            "version": self._version,
+            "version_checks": self.version_checks,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+        }
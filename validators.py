@@ -0,0 +1,52 @@
+"""
+HTTP validators for resources within a user's library.
+
+Shared by the HTML pages (app.py) and the JSON API (api.py), so both
+derive their ETags and answer 304 the same way:
+
+- library_etag: the strong ETag of a resource, from the library version,
+  the request path and query string, and the default page size
+- etag_matches: whether If-None-Match names any representation of an
+  ETag (plain, or the gzip/brotli variant the compression hook sends)
+- set_validators: attach ETag/Last-Modified and require revalidation
+"""
+
+import hashlib
+
+from flask import request
+
+from http_compression import etag_variants
+
+
+def library_etag(user_id, version, page_size):
+    """
+    Return the strong ETag of the requested resource in a user's library.
+
+    Besides the library version, the response depends only on the path,
+    the query string (search term, cursors, fields) and the page size.
+
+    Args:
+        user_id (int): Whose library the resource belongs to;
+        version (int): The library version (0 if never changed);
+        page_size (int): Default page size of list responses.
+    """
+    args = sorted(request.args.items(multi=True))
+    digest = hashlib.sha1(
+        repr((request.path, page_size, args)).encode("utf-8")
+    ).hexdigest()[:16]
+    return f"{user_id}-{version}-{digest}"
+
+
+def etag_matches(etag):
+    """Return True if the request's If-None-Match names any variant of `etag`."""
+    # The client may hold the gzip or brotli representation
+    return any(request.if_none_match.contains(tag) for tag in etag_variants(etag))
+
+
+def set_validators(response, etag, last_modified=None):
+    """Attach ETag/Last-Modified and make the client revalidate every time."""
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response